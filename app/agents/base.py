@@ -22,8 +22,13 @@ class BaseAgent(ABC):
 
     Provides a common interface, logging setup, and the pattern
     that all agents follow: receive a request, produce a result.
+
+    Agents on the per-message hot path declare ``__slots__`` for their own
+    attributes; subclasses that don't simply get a regular ``__dict__``.
     """
 
+    __slots__ = ("name", "logger")
+
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(f"agent.{name}")
@@ -33,6 +38,10 @@ class BaseAgent(ABC):
         """Async initialization (called during app lifespan startup)."""
         ...
 
+    async def warm_up(self) -> None:
+        """Optional: open outbound connections before the first request."""
+        pass
+
     async def shutdown(self) -> None:
         """Optional cleanup (called during app lifespan shutdown)."""
         pass
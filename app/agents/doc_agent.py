@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 # Maximum characters to keep from a fetched documentation page.
 _MAX_PAGE_CHARS = 15_000
+# Per-request timeout for documentation fetches (seconds).
+_HTTP_TIMEOUT = 15.0
 
 # ---------------------------------------------------------------------------
 # Prompts
@@ -114,6 +116,7 @@ class DocAgent(BaseAgent):
         confidence_threshold: float = 0.6,
         skill_agent: SkillAgent | None = None,
         max_results: int = 5,
+        http_client: httpx.AsyncClient | None = None,
     ):
         super().__init__(name="doc")
         self.client = AsyncOpenAI(api_key=api_key)
@@ -123,14 +126,18 @@ class DocAgent(BaseAgent):
         self.threshold = confidence_threshold
         self.skill_agent = skill_agent
         self.max_results = max_results
-        self._http: httpx.AsyncClient | None = None
+        # Shared app-wide client when provided; otherwise created in initialize().
+        self._http: httpx.AsyncClient | None = http_client
+        self._owns_http = False
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     async def initialize(self) -> None:
-        self._http = httpx.AsyncClient(timeout=15.0)
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=_HTTP_TIMEOUT)
+            self._owns_http = True
         self.logger.info(
             "Doc agent initialized (url=%s, model=%s, threshold=%.2f)",
             self.mintlify_url,
@@ -139,7 +146,7 @@ class DocAgent(BaseAgent):
         )
 
     async def shutdown(self) -> None:
-        if self._http:
+        if self._http and self._owns_http:
             await self._http.aclose()
 
     # ------------------------------------------------------------------
@@ -288,7 +295,7 @@ class DocAgent(BaseAgent):
         # Fetch the full llms.txt index
         llms_url = f"{self.mintlify_url}/llms.txt"
         try:
-            resp = await self._http.get(llms_url)
+            resp = await self._http.get(llms_url, timeout=_HTTP_TIMEOUT)
             if trace:
                 with trace.step(
                     "HTTP fetch: llms.txt",
@@ -369,7 +376,7 @@ class DocAgent(BaseAgent):
         for page_url in urls:
             md_url = page_url.rstrip("/") + ".md"
             try:
-                resp = await self._http.get(md_url)
+                resp = await self._http.get(md_url, timeout=_HTTP_TIMEOUT)
                 if resp.status_code == 200:
                     content = resp.text[:_MAX_PAGE_CHARS]
                     title = page_url.split("/")[-1].replace("-", " ").title()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -35,6 +36,8 @@ class MemoryAgent(BaseAgent):
     Also handles the deferred storage pattern for conversation exchanges.
     """
 
+    __slots__ = ("memzero",)
+
     def __init__(self, memzero_agent: MemZeroAgent):
         super().__init__(name="memory")
         self.memzero = memzero_agent
@@ -42,6 +45,12 @@ class MemoryAgent(BaseAgent):
     async def initialize(self) -> None:
         self.logger.info("Memory agent initialized")
 
+    async def warm_up(self) -> None:
+        await self.memzero.warm_up()
+
+    async def shutdown(self) -> None:
+        await self.memzero.shutdown()
+
     async def fetch_context(
         self,
         user_id: str,
@@ -53,11 +62,12 @@ class MemoryAgent(BaseAgent):
         Returns conversation history, global matches, and a precomputed
         confidence adjustment based on Mem0 relevance scores.
         """
-        conv_history = self.memzero.search_conversation_history(
-            user_id, query=message, trace=trace
-        )
-        global_matches = self.memzero.search_global_catalogue(
-            message, trace=trace
+        # Both searches are independent Mem0 round-trips; run them concurrently.
+        conv_history, global_matches = await asyncio.gather(
+            self.memzero.search_conversation_history(
+                user_id, query=message, trace=trace,
+            ),
+            self.memzero.search_global_catalogue(message, trace=trace),
         )
         boost = self._compute_confidence_boost(global_matches)
 
@@ -85,10 +95,17 @@ class MemoryAgent(BaseAgent):
         """Store both sides of a conversation exchange.
 
         Implements the deferred storage pattern: messages are only
-        stored after approval or auto-send, not during intake.
+        stored after approval or auto-send, not during intake.  Both turns
+        go to Mem0 in a single request, run off the event loop.
         """
-        self.memzero.store_conversation_turn(user_id, "user", customer_message)
-        self.memzero.store_conversation_turn(user_id, "assistant", response_text)
+        turns = [
+            (role, content)
+            for role, content in (("user", customer_message), ("assistant", response_text))
+            if content
+        ]
+        if not turns:
+            return
+        await asyncio.to_thread(self.memzero.store_conversation_turns, user_id, turns)
 
     async def store_to_global_catalogue(
         self,
@@ -104,7 +121,8 @@ class MemoryAgent(BaseAgent):
             f"Customer said: {customer_message}\n"
             f"Support said: {response_text}"
         )
-        self.memzero.store_global_catalogue_conversation(
+        await asyncio.to_thread(
+            self.memzero.store_global_catalogue_conversation,
             formatted_conversation=formatted,
             conversation_id=conversation_id,
         )
@@ -120,7 +138,8 @@ class MemoryAgent(BaseAgent):
 
         Returns 0.1 if there is a near-exact match (score >= 0.95), else 0.0.
         """
-        if not global_matches:
-            return 0.0
-        top_score = max(m.get("score", 0) for m in global_matches)
-        return _NEAR_EXACT_MATCH_BOOST if top_score >= _NEAR_EXACT_MATCH_SCORE else 0.0
+        # Stop at the first near-exact match instead of scanning for the max.
+        for m in global_matches:
+            if m.get("score", 0) >= _NEAR_EXACT_MATCH_SCORE:
+                return _NEAR_EXACT_MATCH_BOOST
+        return 0.0
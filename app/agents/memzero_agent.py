@@ -4,33 +4,75 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from mem0 import MemoryClient
+import httpx
+from mem0 import AsyncMemoryClient, MemoryClient
 
 from app.agents.base import BaseAgent
+from app.utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     from app.chat.trace import TraceCollector
 
 
+class _SearchCache(TTLCache[tuple[str, str, int], list[dict]]):
+    """Mem0 search results keyed by (user_id, query, top_k).
+
+    Filled from the event loop but invalidated from the worker threads that
+    run the sync client's writes; TTLCache.invalidate walks a key snapshot.
+    """
+
+    def invalidate_user(self, user_id: str) -> None:
+        self.invalidate(lambda key: key[0] == user_id)
+
+
 class MemZeroAgent(BaseAgent):
     """Dedicated agent for all Mem0 (MemZero) operations.
 
-    Owns the Mem0 SDK client directly and provides the single point
+    Owns the Mem0 SDK clients directly and provides the single point
     of contact for memory storage, search, and retrieval throughout
-    the system.
+    the system. Searches sit on the per-message hot path and use the
+    native async client; writes run off the hot path on the sync client.
+
+    Search results are cached briefly so repeated lookups within a
+    conversation window skip the network; every write invalidates the
+    cached searches for the user it wrote to.
     """
 
-    def __init__(self, api_key: str, global_user_id: str = "global_catalogue"):
+    __slots__ = ("client", "async_client", "global_user_id", "_search_cache", "_http")
+
+    def __init__(
+        self,
+        api_key: str,
+        global_user_id: str = "global_catalogue",
+        search_cache_ttl: float = 60.0,
+        search_cache_max_entries: int = 1024,
+    ):
         super().__init__(name="memzero")
         self.client = MemoryClient(api_key=api_key)
+        # Handed to the async SDK client through its public ``client``
+        # parameter; keeping our own reference lets warm-up and shutdown
+        # avoid the SDK's internals.  Same timeout as the SDK's default.
+        self._http = httpx.AsyncClient(timeout=300)
+        self.async_client = AsyncMemoryClient(api_key=api_key, client=self._http)
         self.global_user_id = global_user_id
+        self._search_cache = _SearchCache(search_cache_ttl, search_cache_max_entries)
 
     async def initialize(self) -> None:
         self.logger.info("MemZero agent initialized")
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the Mem0 API; the response is ignored."""
+        try:
+            await self._http.head("/")
+        except httpx.HTTPError:
+            self.logger.warning("Mem0 connection warm-up failed", exc_info=True)
+
+    async def shutdown(self) -> None:
+        await self._http.aclose()
+
     # --- Search operations ---
 
-    def search_conversation_history(
+    async def search_conversation_history(
         self,
         user_id: str,
         query: str = "",
@@ -38,54 +80,35 @@ class MemZeroAgent(BaseAgent):
         trace: TraceCollector | None = None,
     ) -> list[dict]:
         """Retrieve recent conversation turns for context."""
-        # Mem0 v2 search API requires a non-empty "filters" object; user_id must be inside filters.
-        filters = {"user_id": user_id}
         if trace:
             with trace.step(
                 "Mem0 Search: conversation history",
                 "mem0_search",
                 input_summary=f"user_id={user_id}, top_k={top_k}",
             ) as ev:
-                raw = self.client.search(
-                    query=query or "conversation history",
-                    filters=filters,
-                    top_k=top_k,
-                )
-                results = raw.get("results", raw if isinstance(raw, list) else [])
+                results = await self._search(user_id, query or "conversation history", top_k)
                 ev.output_summary = f"{len(results)} results"
                 ev.details = {
                     "result_count": len(results),
                     "results": results[:5],
                 }
                 return results
-        raw = self.client.search(
-            query=query or "conversation history",
-            filters=filters,
-            top_k=top_k,
-        )
-        return raw.get("results", raw if isinstance(raw, list) else [])
+        return await self._search(user_id, query or "conversation history", top_k)
 
-    def search_global_catalogue(
+    async def search_global_catalogue(
         self,
         query: str,
         top_k: int = 5,
         trace: TraceCollector | None = None,
     ) -> list[dict]:
         """Search the global answer catalogue for relevant past Q&A pairs."""
-        # Mem0 v2 search API requires a non-empty "filters" object; user_id must be inside filters.
-        filters = {"user_id": self.global_user_id}
         if trace:
             with trace.step(
                 "Mem0 Search: global catalogue",
                 "mem0_search",
                 input_summary=f"query={query[:80]}, top_k={top_k}",
             ) as ev:
-                raw = self.client.search(
-                    query=query,
-                    filters=filters,
-                    top_k=top_k,
-                )
-                results = raw.get("results", raw if isinstance(raw, list) else [])
+                results = await self._search(self.global_user_id, query, top_k)
                 top_score = max((m.get("score", 0) for m in results), default=0)
                 ev.output_summary = f"{len(results)} results, top_score={top_score:.3f}"
                 ev.details = {
@@ -94,12 +117,23 @@ class MemZeroAgent(BaseAgent):
                     "results": results[:5],
                 }
                 return results
-        raw = self.client.search(
+        return await self._search(self.global_user_id, query, top_k)
+
+    async def _search(self, user_id: str, query: str, top_k: int) -> list[dict]:
+        """Run a Mem0 search, serving recent identical searches from cache."""
+        key = (user_id, query, top_k)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+        # Mem0 v2 search API requires a non-empty "filters" object; user_id must be inside filters.
+        raw = await self.async_client.search(
             query=query,
-            filters=filters,
+            filters={"user_id": user_id},
             top_k=top_k,
         )
-        return raw.get("results", raw if isinstance(raw, list) else [])
+        results = raw.get("results", raw if isinstance(raw, list) else [])
+        self._search_cache.put(key, results)
+        return results
 
     # --- Store operations ---
 
@@ -111,11 +145,30 @@ class MemZeroAgent(BaseAgent):
     ) -> dict:
         """Store a single conversation turn verbatim (infer=False)."""
         self.logger.info("Storing %s turn for user %s", role, user_id)
-        return self.client.add(
+        result = self.client.add(
             messages=[{"role": role, "content": content}],
             user_id=user_id,
             infer=False,
+            async_mode=True,
         )
+        self._search_cache.invalidate_user(user_id)
+        return result
+
+    def store_conversation_turns(
+        self,
+        user_id: str,
+        turns: list[tuple[str, str]],
+    ) -> dict:
+        """Store several (role, content) turns verbatim in one Mem0 call (infer=False)."""
+        self.logger.info("Storing %d turns for user %s", len(turns), user_id)
+        result = self.client.add(
+            messages=[{"role": role, "content": content} for role, content in turns],
+            user_id=user_id,
+            infer=False,
+            async_mode=True,
+        )
+        self._search_cache.invalidate_user(user_id)
+        return result
 
     def store_global_catalogue(
         self,
@@ -128,15 +181,18 @@ class MemZeroAgent(BaseAgent):
             "Storing Q&A in global catalogue from conversation %s",
             conversation_id,
         )
-        return self.client.add(
+        result = self.client.add(
             messages=[
                 {"role": "user", "content": question},
                 {"role": "assistant", "content": answer},
             ],
             user_id=self.global_user_id,
             infer=False,
+            async_mode=True,
             metadata={"source": "intercom", "conversation_id": conversation_id},
         )
+        self._search_cache.invalidate_user(self.global_user_id)
+        return result
 
     def store_global_catalogue_conversation(
         self,
@@ -148,6 +204,37 @@ class MemZeroAgent(BaseAgent):
             "Storing conversation %s in global catalogue (single-message format)",
             conversation_id,
         )
+        result = self._add_catalogue_conversation(formatted_conversation, conversation_id)
+        self._search_cache.invalidate_user(self.global_user_id)
+        return result
+
+    def store_global_catalogue_conversations(
+        self,
+        items: list[tuple[str, str]],
+    ) -> list[Exception | None]:
+        """Store several (conversation_id, formatted_conversation) pairs.
+
+        Mem0 has no bulk add, and each conversation needs its own metadata,
+        so this still makes one call per item; the cached global searches
+        are invalidated once for the whole batch.  Returns the exception
+        raised for each item, or None where it succeeded.
+        """
+        self.logger.info("Storing %d conversations in global catalogue", len(items))
+        errors: list[Exception | None] = []
+        for conversation_id, formatted_conversation in items:
+            try:
+                self._add_catalogue_conversation(formatted_conversation, conversation_id)
+                errors.append(None)
+            except Exception as exc:
+                errors.append(exc)
+        self._search_cache.invalidate_user(self.global_user_id)
+        return errors
+
+    def _add_catalogue_conversation(
+        self,
+        formatted_conversation: str,
+        conversation_id: str,
+    ) -> dict:
         return self.client.add(
             messages=[{"role": "user", "content": formatted_conversation}],
             user_id=self.global_user_id,
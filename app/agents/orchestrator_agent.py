@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable
+
 import httpx
 
 from app.agents.base import BaseAgent
-from app.agents.memory_agent import MemoryAgent
+from app.agents.memory_agent import MemoryAgent, MemoryContext
 from app.agents.postprocessing_agent import PostProcessingAgent
 from app.agents.precheck_agent import PreCheckAgent
 from app.agents.response_agent import ResponseAgent
 from app.agents.slack_agent import SlackAgent
-from app.models.schemas import ContactInfo, RoutingDecision
+from app.models.schemas import (
+    ContactInfo,
+    GeneratedResponse,
+    PreCheckResult,
+    RoutingDecision,
+)
+
+if TYPE_CHECKING:
+    from app.services.response_cache import SemanticResponseCache
 
 INTERCOM_BASE_URL = "https://api.intercom.io"
+# Cap on concurrent background Mem0 writes (bursts queue behind this).
+_MAX_PENDING_STORES = 64
+# Cap on scheduled writes, running or queued; beyond it new writes are
+# dropped so a burst cannot pile up tasks and payloads without bound.
+_MAX_QUEUED_STORES = 1024
+
+# Canned mock-mode Intercom page, shared across calls instead of being
+# rebuilt each time.  Read-only all the way down.
+_MOCK_EMPTY_PAGE = MappingProxyType(
+    {"conversations": (), "pages": MappingProxyType({})}
+)
 
 
 class OrchestratorAgent(BaseAgent):
@@ -23,6 +47,24 @@ class OrchestratorAgent(BaseAgent):
       Memory Agent -> Response Agent -> PostProcessing Agent -> Route
     """
 
+    __slots__ = (
+        "memory_agent",
+        "response_agent",
+        "postprocessing_agent",
+        "slack_agent",
+        "precheck_agent",
+        "threshold",
+        "response_cache",
+        "_store_semaphore",
+        "_background_tasks",
+        "admin_id",
+        "mock_mode",
+        "sent_replies",
+        "_headers",
+        "_owns_http_client",
+        "_http_client",
+    )
+
     def __init__(
         self,
         memory_agent: MemoryAgent,
@@ -34,6 +76,8 @@ class OrchestratorAgent(BaseAgent):
         intercom_admin_id: str = "",
         mock_mode: bool = False,
         confidence_threshold: float = 0.8,
+        response_cache: SemanticResponseCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         super().__init__(name="orchestrator")
         self.memory_agent = memory_agent
@@ -42,22 +86,30 @@ class OrchestratorAgent(BaseAgent):
         self.slack_agent = slack_agent
         self.precheck_agent = precheck_agent
         self.threshold = confidence_threshold
+        self.response_cache = response_cache
+
+        # Fire-and-forget memory writes: strong refs keep tasks alive until done.
+        self._store_semaphore = asyncio.Semaphore(_MAX_PENDING_STORES)
+        self._background_tasks: set[asyncio.Task] = set()
 
         # Intercom client (owned directly)
         self.admin_id = intercom_admin_id
         self.mock_mode = mock_mode
         self.sent_replies: list[dict] = []  # stores replies in mock mode
 
+        # The HTTP client may be shared app-wide (pooled connections); auth
+        # headers are therefore sent per request rather than baked in.
+        self._headers = {
+            "Authorization": f"Bearer {intercom_access_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._owns_http_client = False
         if not mock_mode and intercom_access_token:
-            self._http_client = httpx.AsyncClient(
-                base_url=INTERCOM_BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {intercom_access_token}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
-                timeout=30.0,
-            )
+            if http_client is None:
+                http_client = httpx.AsyncClient(timeout=30.0)
+                self._owns_http_client = True
+            self._http_client = http_client
         else:
             self._http_client = None
 
@@ -76,16 +128,43 @@ class OrchestratorAgent(BaseAgent):
             mode, precheck_status,
         )
 
+    async def warm_up(self) -> None:
+        """Open TLS connections to every upstream API concurrently.
+
+        Run once at startup so the first webhook does not pay for the
+        handshakes. Failures are logged and otherwise ignored.
+        """
+        agents: list[BaseAgent] = [
+            self.memory_agent,
+            self.response_agent,
+            self.postprocessing_agent,
+            self.slack_agent,
+        ]
+        if self.precheck_agent:
+            agents.append(self.precheck_agent)
+        warmups = [agent.warm_up() for agent in agents]
+        if self._http_client:
+            warmups.append(self._http_client.get(
+                f"{INTERCOM_BASE_URL}/me", headers=self._headers
+            ))
+        results = await asyncio.gather(*warmups, return_exceptions=True)
+        failed = sum(isinstance(r, BaseException) for r in results)
+        self.logger.info(
+            "Warmed %d upstream connections (%d failed)",
+            len(results) - failed, failed,
+        )
+
     async def shutdown(self) -> None:
         """Shutdown all child agents and close HTTP client."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         await self.memory_agent.shutdown()
         if self.precheck_agent:
             await self.precheck_agent.shutdown()
         await self.response_agent.shutdown()
         await self.postprocessing_agent.shutdown()
         await self.slack_agent.shutdown()
-        if self._http_client:
-            await self._http_client.aclose()
+        await self.close()
 
     # --- Intercom operations (absorbed from IntercomClient) ---
 
@@ -105,7 +184,8 @@ class OrchestratorAgent(BaseAgent):
 
         self.logger.info("Replying to conversation %s", conversation_id)
         response = await self._http_client.post(
-            f"/conversations/{conversation_id}/reply",
+            f"{INTERCOM_BASE_URL}/conversations/{conversation_id}/reply",
+            headers=self._headers,
             json={
                 "message_type": "comment",
                 "type": "admin",
@@ -123,31 +203,42 @@ class OrchestratorAgent(BaseAgent):
     ) -> dict:
         """List conversations with cursor-based pagination."""
         if self.mock_mode or self._http_client is None:
-            return {"conversations": [], "pages": {}}
+            return _MOCK_EMPTY_PAGE
 
         params: dict = {"per_page": per_page, "order": "desc", "sort": "updated_at"}
         if starting_after:
             params["starting_after"] = starting_after
-        response = await self._http_client.get("/conversations", params=params)
+        response = await self._http_client.get(
+            f"{INTERCOM_BASE_URL}/conversations",
+            headers=self._headers,
+            params=params,
+        )
         response.raise_for_status()
         return response.json()
 
     async def get_conversation(self, conversation_id: str) -> dict:
         """Retrieve a single conversation with all its parts."""
         if self.mock_mode or self._http_client is None:
+            # Built per call: callers get plain, independently mutable dicts.
             return {
                 "id": conversation_id,
                 "source": {},
                 "conversation_parts": {"conversation_parts": []},
             }
 
-        response = await self._http_client.get(f"/conversations/{conversation_id}")
+        response = await self._http_client.get(
+            f"{INTERCOM_BASE_URL}/conversations/{conversation_id}",
+            headers=self._headers,
+        )
         response.raise_for_status()
         return response.json()
 
     async def close(self) -> None:
-        """Close the HTTP client (alias for shutdown compatibility)."""
-        if self._http_client:
+        """Close the HTTP client if this agent created it.
+
+        A shared client passed in by the caller is left for its owner to close.
+        """
+        if self._http_client and self._owns_http_client:
             await self._http_client.aclose()
 
     # --- Orchestration ---
@@ -179,12 +270,27 @@ class OrchestratorAgent(BaseAgent):
             mem_user_id,
         )
 
+        cache_key_task: asyncio.Task | None = None
         try:
             # Step 1: Fetch memory context via Memory Agent
             memory_context = await self.memory_agent.fetch_context(
                 mem_user_id, message_body
             )
 
+            # The response cache key only needs the message, KB matches and
+            # customer, so its embedding round-trip overlaps the pre-check
+            # LLM call. Without a pre-check there is no follow-up signal, so
+            # the cache is bypassed entirely.
+            if self.response_cache and self.precheck_agent:
+                cache_key_task = asyncio.create_task(
+                    self.response_cache.make_key(
+                        message_body,
+                        memory_context.global_matches,
+                        contact_info,
+                        mem_user_id,
+                    )
+                )
+
             # Step 2: Pre-check classification (if enabled)
             precheck = None
             if self.precheck_agent:
@@ -239,35 +345,39 @@ class OrchestratorAgent(BaseAgent):
                     )
                     return
 
-            # Step 3: Generate response via Response Agent
-            # use_doc_fallback is True only for FULL_PIPELINE routing
-            use_doc_fallback = (
-                precheck is None
-                or precheck.routing_decision == RoutingDecision.FULL_PIPELINE
-            )
-
-            result = await self.response_agent.generate(
-                customer_message=message_body,
-                memory_context=memory_context,
-                contact_info=contact_info,
-                precheck=precheck,
-                use_doc_fallback=use_doc_fallback,
-            )
-
-            self.logger.info(
-                "Conversation %s: confidence=%.2f, threshold=%.2f, route=%s",
-                conversation_id,
-                result.confidence,
-                self.threshold,
-                precheck.routing_decision.value if precheck else "no_precheck",
-            )
-
-            # Step 4: Post-process via PostProcessing Agent
-            result = await self.postprocessing_agent.process(
-                customer_message=message_body,
-                generated_response=result,
-                conversation_history=memory_context.conversation_history,
-            )
+            # Step 3a: Semantic cache lookup — near-duplicate questions against
+            # the same KB matches reuse a previous confident answer.
+            # Follow-ups depend on conversation history, so they never hit
+            # and their answers are never stored.
+            cache_key = None
+            result = None
+            if (
+                cache_key_task is not None
+                and precheck is not None
+                and not precheck.is_followup
+            ):
+                cache_key = await cache_key_task
+                if cache_key is not None:
+                    result = self.response_cache.lookup(cache_key)
+
+            if result is not None:
+                self.logger.info(
+                    "Conversation %s: served from response cache (confidence=%.2f)",
+                    conversation_id,
+                    result.confidence,
+                )
+            else:
+                result = await self._generate_and_refine(
+                    conversation_id, message_body, memory_context,
+                    contact_info, precheck,
+                )
+                if (
+                    cache_key is not None
+                    and result.text
+                    and not result.is_followup
+                    and result.confidence >= self.threshold
+                ):
+                    self.response_cache.store(cache_key, result)
 
             # Step 5: Route based on confidence
             if result.confidence >= self.threshold:
@@ -292,6 +402,52 @@ class OrchestratorAgent(BaseAgent):
                 "Error processing message for conversation %s",
                 conversation_id,
             )
+        finally:
+            # Escalations, greetings and follow-ups never use the key.
+            if cache_key_task is not None and not cache_key_task.done():
+                cache_key_task.cancel()
+
+    async def _generate_and_refine(
+        self,
+        conversation_id: str,
+        message_body: str,
+        memory_context: MemoryContext,
+        contact_info: ContactInfo | None,
+        precheck: PreCheckResult | None,
+    ) -> GeneratedResponse:
+        """Run answer generation (Step 3) and post-processing (Step 4)."""
+        # use_doc_fallback is True only for FULL_PIPELINE routing
+        use_doc_fallback = (
+            precheck is None
+            or precheck.routing_decision == RoutingDecision.FULL_PIPELINE
+        )
+
+        result = await self.response_agent.generate(
+            customer_message=message_body,
+            memory_context=memory_context,
+            contact_info=contact_info,
+            precheck=precheck,
+            use_doc_fallback=use_doc_fallback,
+        )
+
+        self.logger.info(
+            "Conversation %s: confidence=%.2f, threshold=%.2f, route=%s",
+            conversation_id,
+            result.confidence,
+            self.threshold,
+            precheck.routing_decision.value if precheck else "no_precheck",
+        )
+
+        # Nothing to refine: neither the primary LLM nor the skill fallback
+        # produced an answer, so this goes straight to human review.
+        if not result.text.strip():
+            return result
+
+        return await self.postprocessing_agent.process(
+            customer_message=message_body,
+            generated_response=result,
+            conversation_history=memory_context.conversation_history,
+        )
 
     async def send_approved_response(
         self,
@@ -302,12 +458,16 @@ class OrchestratorAgent(BaseAgent):
         edited: bool = False,
         reasoning: str = "",
     ) -> None:
-        """Send a human-approved (or edited) response to Intercom."""
+        """Send a human-approved (or edited) response to Intercom.
+
+        Memory writes are scheduled in the background once the reply is out.
+        """
         await self.reply_to_conversation(conversation_id, response_text)
 
         if user_id:
-            await self.memory_agent.store_exchange(
-                user_id, customer_message, response_text
+            self._store_in_background(
+                self.memory_agent.store_exchange(user_id, customer_message, response_text),
+                f"exchange for user {user_id}",
             )
 
         # Store in global catalogue if:
@@ -316,11 +476,14 @@ class OrchestratorAgent(BaseAgent):
         is_skill_agent_response = reasoning.startswith("[Skill Agent]")
         if (edited or is_skill_agent_response) and customer_message:
             source_label = "edited" if edited else "skill-agent-approved"
-            await self.memory_agent.store_to_global_catalogue(
-                conversation_id=conversation_id,
-                customer_message=customer_message,
-                response_text=response_text,
-                source_label=source_label,
+            self._store_in_background(
+                self.memory_agent.store_to_global_catalogue(
+                    conversation_id=conversation_id,
+                    customer_message=customer_message,
+                    response_text=response_text,
+                    source_label=source_label,
+                ),
+                f"global catalogue entry for conversation {conversation_id}",
             )
 
         self.logger.info(
@@ -334,11 +497,42 @@ class OrchestratorAgent(BaseAgent):
         customer_message: str,
         response_text: str,
     ) -> None:
-        """Auto-send a high-confidence response and store context."""
+        """Auto-send a high-confidence response and store context.
+
+        The memory write is scheduled in the background so the pipeline
+        finishes as soon as the reply is delivered.
+        """
         await self.reply_to_conversation(conversation_id, response_text)
-        await self.memory_agent.store_exchange(
-            user_id, customer_message, response_text
+        self._store_in_background(
+            self.memory_agent.store_exchange(user_id, customer_message, response_text),
+            f"exchange for user {user_id}",
         )
         self.logger.info(
             "Auto-responded to conversation %s", conversation_id
         )
+
+    def _store_in_background(self, store: Awaitable[None], what: str) -> None:
+        """Schedule a memory write; shutdown() waits for pending ones.
+
+        When _MAX_QUEUED_STORES writes are already scheduled, the write is
+        dropped and logged instead.
+        """
+        if len(self._background_tasks) >= _MAX_QUEUED_STORES:
+            self.logger.warning(
+                "Background store queue full (%d), dropping %s",
+                _MAX_QUEUED_STORES, what,
+            )
+            if inspect.iscoroutine(store):
+                store.close()
+            return
+        task = asyncio.create_task(self._guarded_store(store, what))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _guarded_store(self, store: Awaitable[None], what: str) -> None:
+        """Await a memory write, logging (not raising) failures."""
+        async with self._store_semaphore:
+            try:
+                await store
+            except Exception:
+                self.logger.exception("Background memory store failed (%s)", what)
@@ -7,9 +7,10 @@ AI-generated response before routing.
 
 from __future__ import annotations
 
-import json
+import re
 from typing import TYPE_CHECKING
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.agents.base import BaseAgent
@@ -19,6 +20,56 @@ from app.models.schemas import GeneratedResponse, PostProcessorInput, PostProces
 if TYPE_CHECKING:
     from app.chat.trace import TraceCollector
 
+# Routes post-processor requests to the same prompt-cache bucket so the
+# large static system prompt is served from OpenAI's prefix cache.
+_PROMPT_CACHE_KEY = "postprocessor-v1"
+
+# Short first-turn drafts are returned as-is unless they contain something
+# the fixer would change: hedging and filler phrases, emojis / em dashes,
+# markdown or HTML, or code.
+_CLEAN_SKIP_MAX_CHARS = 800
+
+# Static framing of the post-processor user message; only the fields
+# between these are filled in per call.
+_HISTORY_HEADER = "## Recent Conversation History\n\n"
+_HISTORY_FOOTER = "\n\n---\n\n"
+_CUSTOMER_HEADER = "## Customer Message\n\n"
+_RESPONSE_HEADER = "\n\n\n---\n\n\n## Generated Response\n\n"
+_CONFIDENCE_HEADER = "\n\n\n---\n\n\n## Original Confidence: "
+_REASONING_HEADER = "\n\n\n## Original Reasoning\n\n"
+_NEEDS_FIXING_PATTERNS = (
+    r"\bi\s+don['’]t\s+(?:know|have\s+information)",
+    r"\bi\s+will\s+search",
+    r"\bi['’]m\s+not\s+sure",
+    r"\blet\s+me\s+(?:look\s+into|help\s+you)",
+    r"\bbased\s+on\s+my\s+knowledge",
+    r"\bas\s+an?\s+(?:ai|support\s+agent)\b",
+    r"\bgreat\s+question",
+    r"\b(?:sure|absolutely|of\s+course)!",
+    r"\bi['’]d\s+be\s+happy\s+to\s+help",
+    r"\b(?:i\s+think|it\s+seems|i\s+believe|if\s+i['’]m\s+not\s+mistaken)\b",
+    r"\b(?:to\s+answer\s+your\s+question|in\s+response\s+to\s+your\s+query)\b",
+    r"\b(?:sorry|apologi[sz]e|apologies)\b",
+    r"\bunable\s+to\s+help",
+    r"[\u2014\u2600-\u27BF\U0001F300-\U0001FAFF]",
+    r"[`*#<>\[\]]|:\)|:D",
+)
+
+
+def _build_needs_fixing_re(cfg: CompanyConfig) -> re.Pattern[str]:
+    """Pattern matching drafts the post-processor LLM must see.
+
+    Obsolete parameter names from the company config are included so their
+    removal rule is never bypassed.
+    """
+    params = (
+        re.escape(name) for op in cfg.obsolete_parameters for name in op.param_names
+    )
+    return re.compile(
+        "|".join((*_NEEDS_FIXING_PATTERNS, *(rf"\b{p}\b" for p in params))),
+        re.IGNORECASE,
+    )
+
 
 def build_post_processor_system_prompt(config: CompanyConfig | None = None) -> str:
     """Build the post-processor system prompt from company configuration.
@@ -42,16 +93,14 @@ def build_post_processor_system_prompt(config: CompanyConfig | None = None) -> s
     )
 
     # Obsolete parameter rules
-    obsolete_rules = ""
-    for op in cfg.obsolete_parameters:
-        obsolete_rules += f"\n### Obsolete parameters removal\n{op.note}\n"
+    obsolete_rules = "".join(
+        f"\n### Obsolete parameters removal\n{op.note}\n" for op in cfg.obsolete_parameters
+    )
 
     # Extra company-specific rules
     extra_rules = ""
     if cfg.post_processor_extra_rules:
-        extra_rules = "\n\nALSO REMEMBER THAT " + "\n\n".join(
-            rule.upper() for rule in cfg.post_processor_extra_rules
-        )
+        extra_rules = "\n\nALSO REMEMBER THAT " + cfg.post_processor_extra_rules_upper
 
     # Example URLs based on company docs
     example_url = f"{cfg.documentation_url}/platform/quickstart"
@@ -197,7 +246,7 @@ If the response PASSES the relevance check:
 
 ---
 
-## PLAIN TEXT FORMATTING FOR {cfg.support_platform_name.upper()}
+## PLAIN TEXT FORMATTING FOR {cfg.support_platform_name_upper}
 
 The refined_text will be sent directly into {cfg.support_platform_name} chat, which displays plain text.
 Do NOT use markdown or HTML. Output clean, readable plain text only.
@@ -259,11 +308,24 @@ class PostProcessingAgent(BaseAgent):
     (Fixer for tone + Judge for confidence re-evaluation).
     """
 
+    __slots__ = (
+        "_api_key",
+        "model",
+        "client",
+        "_system_prompt",
+        "_needs_fixing_re",
+        "_request_options",
+        "threshold",
+    )
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "gpt-5",
         company_cfg: CompanyConfig | None = None,
+        max_completion_tokens: int = 4096,
+        reasoning_effort: str = "low",
+        confidence_threshold: float = 0.8,
     ):
         super().__init__(name="postprocessing")
         self._api_key = api_key
@@ -272,6 +334,15 @@ class PostProcessingAgent(BaseAgent):
         if api_key:
             self.client = AsyncOpenAI(api_key=api_key)
         self._system_prompt = build_post_processor_system_prompt(company_cfg)
+        self._needs_fixing_re = _build_needs_fixing_re(company_cfg or company_config)
+        # Auto-send threshold; only drafts below it may skip the LLM pass.
+        self.threshold = confidence_threshold
+        # Bound decode length (refined text + reasoning rarely need much) and
+        # keep reasoning short; a truncated reply fails JSON parsing and
+        # falls back to the original response.
+        self._request_options: dict = {"max_completion_tokens": max_completion_tokens}
+        if reasoning_effort:
+            self._request_options["reasoning_effort"] = reasoning_effort
 
     @property
     def is_enabled(self) -> bool:
@@ -281,6 +352,10 @@ class PostProcessingAgent(BaseAgent):
         status = "enabled" if self.is_enabled else "disabled"
         self.logger.info("Post-processing agent initialized (%s)", status)
 
+    async def warm_up(self) -> None:
+        if self.client is not None:
+            await self.client.with_options(max_retries=0).models.list()
+
     async def process(
         self,
         customer_message: str,
@@ -290,8 +365,9 @@ class PostProcessingAgent(BaseAgent):
     ) -> GeneratedResponse:
         """Post-process a generated response.
 
-        If the post-processor is disabled or the response is empty,
-        returns the input unchanged.
+        If the post-processor is disabled, the response is empty, or it is
+        a short first-turn answer with nothing to fix that is headed for
+        human review anyway, returns the input unchanged.
         """
         if not self.is_enabled:
             return generated_response
@@ -299,6 +375,24 @@ class PostProcessingAgent(BaseAgent):
         if not generated_response.text.strip():
             return generated_response
 
+        if self._is_clean(generated_response, conversation_history):
+            # The judge's relevance check and code filter still apply to
+            # first-turn answers, so only drafts a human reviews anyway skip
+            # them; auto-send candidates always get the LLM pass.
+            if trace:
+                with trace.step(
+                    "Post-Processing Agent (clean skip)",
+                    "computation",
+                    input_summary=f"response_len={len(generated_response.text)} chars",
+                ) as ev:
+                    ev.output_summary = "response already clean (no LLM call)"
+                    ev.details = {
+                        "confidence": generated_response.confidence,
+                        "threshold": self.threshold,
+                    }
+            self.logger.info("Post-processor skipped: response already clean")
+            return generated_response
+
         try:
             pp_input = PostProcessorInput(
                 customer_message=customer_message,
@@ -308,13 +402,6 @@ class PostProcessingAgent(BaseAgent):
                 conversation_history=conversation_history or [],
             )
 
-            if not pp_input.generated_response.strip():
-                return GeneratedResponse(
-                    text="",
-                    confidence=pp_input.original_confidence,
-                    reasoning="Empty response -- skipped post-processing.",
-                )
-
             user_prompt = self._build_user_prompt(pp_input)
             pp_output = await self._call_llm(user_prompt, pp_input.original_confidence, trace)
 
@@ -344,13 +431,36 @@ class PostProcessingAgent(BaseAgent):
             )
             return generated_response
 
+    def _is_clean(
+        self, response: GeneratedResponse, conversation_history: list[dict] | None
+    ) -> bool:
+        """True if the LLM pass can be skipped.
+
+        Only short first-turn drafts below the auto-send threshold with no
+        tone or formatting issue the regex can see qualify. The LLM's
+        relevance check and code filter are not covered by the regex, so
+        anything that could auto-send still goes through them.
+        """
+        text = response.text
+        return (
+            response.confidence < self.threshold
+            and not conversation_history
+            and len(text) < _CLEAN_SKIP_MAX_CHARS
+            and self._needs_fixing_re.search(text) is None
+        )
+
     async def _call_llm(
         self,
         user_prompt: str,
         original_confidence: float,
         trace: TraceCollector | None = None,
     ) -> PostProcessorOutput:
-        """Call the LLM and parse the post-processor output."""
+        """Call the LLM and parse the post-processor output.
+
+        The system message is identical on every call and all per-request
+        data lives in the user message, so the system prompt forms a
+        cacheable prefix.
+        """
         messages = [
             {"role": "system", "content": self._system_prompt},
             {"role": "user", "content": user_prompt},
@@ -360,13 +470,17 @@ class PostProcessingAgent(BaseAgent):
             model=self.model,
             messages=messages,
             response_format={"type": "json_object"},
+            extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
+            **self._request_options,
         )
         raw = response.choices[0].message.content
         self.logger.debug("[Post-Processing] LLM response: %s", raw)
-        parsed = json.loads(raw)
+        details = getattr(response.usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        parsed = orjson.loads(raw)
         pp_output = PostProcessorOutput(
             refined_text=parsed["refined_text"],
-            final_confidence=float(parsed["final_confidence"]),
+            final_confidence=min(1.0, max(0.0, float(parsed["final_confidence"]))),
             reasoning=parsed.get("reasoning", ""),
             response_addresses_question=parsed.get("response_addresses_question", True),
         )
@@ -394,6 +508,7 @@ class PostProcessingAgent(BaseAgent):
                     "usage": {
                         "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
                         "completion_tokens": response.usage.completion_tokens if response.usage else None,
+                        "cached_tokens": cached_tokens,
                     },
                 }
 
@@ -405,16 +520,18 @@ class PostProcessingAgent(BaseAgent):
         parts = []
 
         if pp_input.conversation_history:
-            parts.append("## Recent Conversation History\n")
-            for mem in pp_input.conversation_history:
-                parts.append(mem.get("memory", ""))
-            parts.append("\n---\n")
-
-        parts.append(f"## Customer Message\n\n{pp_input.customer_message}\n\n")
-        parts.append("---\n\n")
-        parts.append(f"## Generated Response\n\n{pp_input.generated_response}\n\n")
-        parts.append("---\n\n")
-        parts.append(f"## Original Confidence: {pp_input.original_confidence}\n\n")
-        parts.append(f"## Original Reasoning\n\n{pp_input.original_reasoning}")
-
-        return "\n".join(parts)
+            parts.append(_HISTORY_HEADER)
+            parts.append("\n".join(mem.get("memory", "") for mem in pp_input.conversation_history))
+            parts.append(_HISTORY_FOOTER)
+
+        parts += (
+            _CUSTOMER_HEADER,
+            pp_input.customer_message,
+            _RESPONSE_HEADER,
+            pp_input.generated_response,
+            _CONFIDENCE_HEADER,
+            str(pp_input.original_confidence),
+            _REASONING_HEADER,
+            pp_input.original_reasoning,
+        )
+        return "".join(parts)
@@ -13,9 +13,10 @@ for non-technical questions.
 
 from __future__ import annotations
 
-import json
+import re
 from typing import TYPE_CHECKING
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.agents.base import BaseAgent
@@ -25,6 +26,39 @@ from app.models.schemas import PreCheckResult, QuestionType, RoutingDecision
 if TYPE_CHECKING:
     from app.chat.trace import TraceCollector
 
+# Explicit requests for a human (the unambiguous Step 3 patterns of the
+# classifier prompt).  These are matched locally so they escalate without an
+# LLM call.  The request must make up a whole sentence -- optionally with a
+# greeting or "can I" / "I want to" in front and "please" after -- so that
+# e.g. "transfer me the ownership of this project" or "talk to a human about
+# billing" are left to the classifier along with anything subtler.
+_HUMAN_TARGET = (
+    r"(?:a\s+|an\s+)?(?:real\s+|live\s+)?"
+    r"(?:human(?:\s+being)?|person|representative|human\s+agent|support\s+agent|live\s+agent)"
+)
+_HUMAN_REQUEST_RE = re.compile(
+    rf"""
+    (?:^|[.!?]\s+)                             # start of a sentence
+    (?:(?:hi|hello|hey)\b[\s,!]*)?
+    (?:please\s+)?
+    (?:(?:can|could|may)\s+i\s+|i\s+(?:want|need|would\s+like)\s+to\s+
+       |i'd\s+like\s+to\s+|let\s+me\s+)?
+    (?:
+        (?:talk|speak|chat)\s+(?:to|with)\s+{_HUMAN_TARGET}
+      | (?:transfer|connect|put)\s+me\s+(?:to|with|through\s+to)\s+
+        (?:{_HUMAN_TARGET}|(?:the\s+)?support(?:\s+team)?|(?:a\s+|an\s+)?agent)
+      | (?:i\s+(?:want|need)\s+)?(?:a\s+)?real\s+(?:person|human)
+      | escalate\s+this(?:\s+to\s+(?:a\s+)?(?:human|person|manager))?
+      | get\s+me\s+a\s+manager
+      | i\s+need\s+human\s+help
+      | this\s+bot\s+is\s+not\s+helping
+    )
+    (?:\s+please)?
+    \s*(?:[.!?]|$)                              # ...through to its end
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
 
 def build_precheck_system_prompt(config: CompanyConfig | None = None) -> str:
     """Build the pre-check classifier system prompt."""
@@ -169,6 +203,9 @@ class PreCheckAgent(BaseAgent):
     async def initialize(self) -> None:
         self.logger.info("Pre-check agent initialized (model=%s)", self.model)
 
+    async def warm_up(self) -> None:
+        await self.client.with_options(max_retries=0).models.list()
+
     async def classify(
         self,
         customer_message: str,
@@ -189,6 +226,9 @@ class PreCheckAgent(BaseAgent):
         trace:
             Optional trace collector for the pipeline UI.
         """
+        if _HUMAN_REQUEST_RE.search(customer_message):
+            return self._human_requested(customer_message, trace)
+
         user_prompt = self._build_user_prompt(
             customer_message, conversation_history or [], global_matches or []
         )
@@ -204,7 +244,7 @@ class PreCheckAgent(BaseAgent):
 
         raw = response.choices[0].message.content
         self.logger.debug("[Pre-Check] LLM response: %s", raw)
-        parsed = json.loads(raw)
+        parsed = orjson.loads(raw)
 
         result = PreCheckResult(
             question_type=QuestionType(parsed.get("question_type", "technical")),
@@ -258,6 +298,30 @@ class PreCheckAgent(BaseAgent):
 
         return result
 
+    def _human_requested(
+        self,
+        customer_message: str,
+        trace: TraceCollector | None,
+    ) -> PreCheckResult:
+        """Escalation result for an explicit request to talk to a human."""
+        result = PreCheckResult(
+            question_type=QuestionType.NON_TECHNICAL,
+            routing_decision=RoutingDecision.ESCALATE,
+            requires_human_intervention=True,
+            answerable_from_context=False,
+            reasoning="User explicitly asked for a human.",
+        )
+        if trace:
+            with trace.step(
+                "Pre-Check Agent (pattern match)",
+                "computation",
+                input_summary=f"message_len={len(customer_message)} chars",
+            ) as ev:
+                ev.output_summary = "route=escalate, human=True (no LLM call)"
+                ev.details = {"intent_category": "user_asked_for_human"}
+        self.logger.info("Pre-check: explicit human request, escalating without LLM")
+        return result
+
     @staticmethod
     def _build_user_prompt(
         customer_message: str,
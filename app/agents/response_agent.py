@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+import asyncio
+import re
+from typing import TYPE_CHECKING, Callable, TypedDict
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.agents.base import BaseAgent
 from app.agents.memory_agent import MemoryContext
 from app.models.schemas import ContactInfo, GeneratedResponse, PreCheckResult
-from app.prompts import SYSTEM_PROMPT, build_user_prompt
+from app.prompts import build_system_prompt, build_user_prompt
 
 if TYPE_CHECKING:
     from app.chat.trace import TraceCollector
@@ -19,6 +21,37 @@ if TYPE_CHECKING:
 # Minimum raw confidence before a memory boost can be applied.
 _MEMORY_BOOST_MIN_CONFIDENCE = 0.7
 
+# Matches a completed top-level "confidence" value in a partially streamed
+# JSON object. The terminating "," or "}" guarantees the number is whole.
+_STREAMED_CONFIDENCE_RE = re.compile(r'"confidence"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
+_EMPTY_RESPONSE_TEXT_RE = re.compile(r'"response_text"\s*:\s*""')
+# Characters of already-scanned output kept when looking for the confidence
+# field, so a key split across deltas is still found without rescanning the
+# whole buffer on every delta.
+_CONFIDENCE_SCAN_OVERLAP = 128
+
+# An empty answer streamed with confidence below this is final: the rest of
+# the stream (the reasoning) is not read.
+_EARLY_STOP_MAX_CONFIDENCE = 0.5
+
+# Completions larger than this are parsed in a worker thread so one huge
+# output cannot stall the event loop.  orjson parses typical (few KB)
+# answers in microseconds -- less than a thread hop -- so only outliers
+# are offloaded.
+_OFFLOAD_PARSE_CHARS = 64 * 1024
+
+
+class _LLMOutput(TypedDict, total=False):
+    """Shape of the JSON object the response prompt asks the model for."""
+
+    response_text: str
+    confidence: float
+    reasoning: str
+    requires_human_intervention: bool
+    is_followup: bool
+    followup_context: str
+    answerable_from_context: bool
+
 
 class ResponseAgent(BaseAgent):
     """Generates AI responses using OpenAI and memory context.
@@ -45,6 +78,9 @@ class ResponseAgent(BaseAgent):
     async def initialize(self) -> None:
         self.logger.info("Response agent initialized (model=%s)", self.model)
 
+    async def warm_up(self) -> None:
+        await self.client.with_options(max_retries=0).models.list()
+
     async def generate(
         self,
         customer_message: str,
@@ -70,27 +106,45 @@ class ResponseAgent(BaseAgent):
             Whether to attempt the skill/doc agent fallback on low confidence.
             Set to False for non-technical questions (KB_ONLY routing).
         """
+        # The response is streamed. The prompt asks for "confidence" before
+        # "reasoning", so once it arrives we already know whether the skill
+        # fallback will run and can start it while the reasoning streams in.
+        # Only possible with a pre-check: otherwise the human-intervention
+        # flag is part of the LLM output and unknown until the stream ends.
+        skill_task: asyncio.Task | None = None
+
+        def _on_confidence(raw: float) -> None:
+            nonlocal skill_task
+            if self._wants_skill_fallback(
+                self._boost_confidence(raw, memory_context),
+                precheck.requires_human_intervention,
+                use_doc_fallback,
+            ):
+                skill_task = asyncio.create_task(
+                    self._ask_skill_agent(customer_message, trace)
+                )
+
+        early_fallback = self.skill_agent is not None and precheck is not None
+
         # Step 1: Primary OpenAI generation
-        result = await self._call_openai(
-            customer_message=customer_message,
-            conversation_history=memory_context.conversation_history,
-            relevant_memories=memory_context.global_matches,
-            contact_info=contact_info,
-            trace=trace,
-            precheck=precheck,
-        )
+        try:
+            result = await self._call_openai(
+                customer_message=customer_message,
+                conversation_history=memory_context.conversation_history,
+                relevant_memories=memory_context.global_matches,
+                contact_info=contact_info,
+                trace=trace,
+                precheck=precheck,
+                on_confidence=_on_confidence if early_fallback else None,
+            )
+        except BaseException:
+            if skill_task is not None:
+                skill_task.cancel()
+            raise
 
         # Step 2: Apply memory-based confidence adjustment
         raw_confidence = result.confidence
-        adjusted_confidence = result.confidence
-        if (
-            memory_context.adjusted_confidence_boost > 0
-            and adjusted_confidence >= _MEMORY_BOOST_MIN_CONFIDENCE
-        ):
-            adjusted_confidence = min(
-                adjusted_confidence + memory_context.adjusted_confidence_boost,
-                1.0,
-            )
+        adjusted_confidence = self._boost_confidence(raw_confidence, memory_context)
 
         if trace:
             with trace.step(
@@ -120,6 +174,7 @@ class ResponseAgent(BaseAgent):
         result, adjusted_confidence = await self._try_skill_fallback(
             result, adjusted_confidence, customer_message, trace,
             use_doc_fallback=use_doc_fallback,
+            skill_task=skill_task,
         )
 
         return GeneratedResponse(
@@ -132,6 +187,38 @@ class ResponseAgent(BaseAgent):
             answerable_from_context=result.answerable_from_context,
         )
 
+    @staticmethod
+    def _boost_confidence(confidence: float, memory_context: MemoryContext) -> float:
+        """Apply the memory boost (only to already-confident answers)."""
+        if (
+            memory_context.adjusted_confidence_boost > 0
+            and confidence >= _MEMORY_BOOST_MIN_CONFIDENCE
+        ):
+            return min(confidence + memory_context.adjusted_confidence_boost, 1.0)
+        return confidence
+
+    def _wants_skill_fallback(
+        self,
+        adjusted_confidence: float,
+        requires_human: bool,
+        use_doc_fallback: bool,
+    ) -> bool:
+        # Skip fallback if the user explicitly asked for a human agent,
+        # or if the pre-check decided this is a KB-only question.
+        return (
+            self.skill_agent is not None
+            and adjusted_confidence < self.threshold
+            and not requires_human
+            and use_doc_fallback
+        )
+
+    async def _ask_skill_agent(self, customer_message: str, trace: TraceCollector | None):
+        # DocAgent.answer() accepts trace; bare SkillAgent.answer() does not.
+        try:
+            return await self.skill_agent.answer(customer_message, trace=trace)
+        except TypeError:
+            return await self.skill_agent.answer(customer_message)
+
     async def _try_skill_fallback(
         self,
         result: GeneratedResponse,
@@ -139,33 +226,31 @@ class ResponseAgent(BaseAgent):
         customer_message: str,
         trace: TraceCollector | None = None,
         use_doc_fallback: bool = True,
+        skill_task: asyncio.Task | None = None,
     ) -> tuple[GeneratedResponse, float]:
         """Attempt skill agent fallback if confidence is below threshold.
 
+        *skill_task* is a skill agent call already started while the primary
+        response was streaming; it is awaited instead of issuing a new call.
+
         Returns the (possibly updated) result and adjusted confidence.
         """
-        # Skip fallback if the user explicitly asked for a human agent,
-        # or if the pre-check decided this is a KB-only question.
-        skip_fallback = result.requires_human_intervention or not use_doc_fallback
+        wants_fallback = self._wants_skill_fallback(
+            adjusted_confidence, result.requires_human_intervention, use_doc_fallback
+        )
+        if skill_task is not None and not wants_fallback:
+            skill_task.cancel()
 
-        if (
-            self.skill_agent is not None
-            and adjusted_confidence < self.threshold
-            and not skip_fallback
-        ):
+        if wants_fallback:
             self.logger.info(
                 "Primary AI below threshold (confidence=%.2f), trying skill agent",
                 adjusted_confidence,
             )
             try:
-                # DocAgent.answer() accepts trace; bare SkillAgent.answer() does not.
-                has_trace_param = hasattr(self.skill_agent, "answer")
-                try:
-                    skill_result = await self.skill_agent.answer(
-                        customer_message, trace=trace
-                    )
-                except TypeError:
-                    skill_result = await self.skill_agent.answer(customer_message)
+                if skill_task is not None:
+                    skill_result = await skill_task
+                else:
+                    skill_result = await self._ask_skill_agent(customer_message, trace)
 
                 used = bool(
                     skill_result.answer_text
@@ -235,53 +320,89 @@ class ResponseAgent(BaseAgent):
         contact_info: ContactInfo | None = None,
         trace: TraceCollector | None = None,
         precheck: PreCheckResult | None = None,
+        on_confidence: Callable[[float], None] | None = None,
     ) -> GeneratedResponse:
         """Call OpenAI to generate a response with confidence score.
 
         The LLM now returns only ``response_text``, ``confidence``, and
         ``reasoning``.  Classification fields (human intervention, follow-up,
         answerability) come from the *precheck* result when available.
+
+        The completion is streamed; *on_confidence* is called with the raw
+        confidence as soon as that field has been fully received.  With a
+        pre-check, an empty answer at low confidence ends the stream right
+        there -- nothing after it affects the outcome.
         """
         user_prompt = build_user_prompt(
             customer_message, conversation_history, relevant_memories, contact_info
         )
 
-        response = await self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "system", "content": build_system_prompt()},
                 {"role": "user", "content": user_prompt},
             ],
             response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
         )
 
-        raw = response.choices[0].message.content
+        chunks: list[str] = []
+        usage = None
+        streamed_confidence: float | None = None
+        stopped_early = False
+        # Unmatched tail of the output seen so far; only this plus the new
+        # delta is searched, keeping the scan linear in the response length.
+        scan_window = ""
+        async for chunk in stream:
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            delta = chunk.choices[0].delta.content
+            chunks.append(delta)
+            if streamed_confidence is None:
+                scan_window = scan_window[-_CONFIDENCE_SCAN_OVERLAP:] + delta
+                match = _STREAMED_CONFIDENCE_RE.search(scan_window)
+                if match:
+                    streamed_confidence = float(match.group(1))
+                    if on_confidence is not None:
+                        on_confidence(streamed_confidence)
+                    if (
+                        precheck is not None
+                        and streamed_confidence < _EARLY_STOP_MAX_CONFIDENCE
+                        and _EMPTY_RESPONSE_TEXT_RE.search("".join(chunks))
+                    ):
+                        stopped_early = True
+                        break
+
+        raw = "".join(chunks)
         self.logger.debug("[Primary Generation] LLM response: %s", raw)
-        parsed = json.loads(raw)
-
-        # Classification fields come from precheck when available;
-        # fall back to LLM output for backward compatibility (e.g. chat UI
-        # tests that don't use the precheck agent).
-        if precheck is not None:
-            requires_human = precheck.requires_human_intervention
-            is_followup = precheck.is_followup
-            followup_ctx = precheck.followup_context
-            answerable = precheck.answerable_from_context
+        if stopped_early:
+            await stream.close()
+
+        # The system prompt is a static prefix (all per-request context lives in
+        # the user message), so OpenAI's automatic prompt caching applies.
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if usage is not None:
+            self.logger.debug(
+                "[Primary Generation] prompt_tokens=%s cached_tokens=%s",
+                usage.prompt_tokens, cached_tokens,
+            )
+        if stopped_early:
+            parsed = {
+                "response_text": "",
+                "confidence": streamed_confidence,
+                "reasoning": "Empty low-confidence answer; stream stopped before reasoning.",
+            }
+        elif len(raw) > _OFFLOAD_PARSE_CHARS:
+            parsed = await asyncio.to_thread(orjson.loads, raw)
         else:
-            requires_human = parsed.get("requires_human_intervention", False)
-            is_followup = parsed.get("is_followup", False)
-            followup_ctx = parsed.get("followup_context", "")
-            answerable = parsed.get("answerable_from_context", True)
+            parsed = orjson.loads(raw)
 
-        result = GeneratedResponse(
-            text=parsed["response_text"],
-            confidence=float(parsed["confidence"]),
-            reasoning=parsed.get("reasoning", ""),
-            requires_human_intervention=requires_human,
-            is_followup=is_followup,
-            followup_context=followup_ctx,
-            answerable_from_context=answerable,
-        )
+        result = self._result_from_output(parsed, precheck)
 
         if trace:
             with trace.step(
@@ -298,14 +419,50 @@ class ResponseAgent(BaseAgent):
                     "reasoning": parsed.get("reasoning", ""),
                     "response_preview": parsed["response_text"][:200],
                     "precheck_used": precheck is not None,
-                    "requires_human_intervention": requires_human,
-                    "is_followup": is_followup,
-                    "followup_context": followup_ctx,
-                    "answerable_from_context": answerable,
+                    "requires_human_intervention": result.requires_human_intervention,
+                    "is_followup": result.is_followup,
+                    "followup_context": result.followup_context,
+                    "answerable_from_context": result.answerable_from_context,
                     "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                        "completion_tokens": response.usage.completion_tokens if response.usage else None,
+                        "prompt_tokens": usage.prompt_tokens if usage else None,
+                        "completion_tokens": usage.completion_tokens if usage else None,
+                        "cached_tokens": cached_tokens,
                     },
                 }
 
         return result
+
+    @staticmethod
+    def _result_from_output(
+        parsed: _LLMOutput,
+        precheck: PreCheckResult | None = None,
+    ) -> GeneratedResponse:
+        """Build the response from parsed LLM output without re-validation.
+
+        ``response_format=json_object`` guarantees a JSON object; the only
+        fields needing coercion are converted explicitly, so the pydantic
+        validation pass is skipped with ``model_construct``.
+        """
+        # Classification fields come from precheck when available;
+        # fall back to LLM output for backward compatibility (e.g. chat UI
+        # tests that don't use the precheck agent).
+        if precheck is not None:
+            requires_human = precheck.requires_human_intervention
+            is_followup = precheck.is_followup
+            followup_ctx = precheck.followup_context
+            answerable = precheck.answerable_from_context
+        else:
+            requires_human = bool(parsed.get("requires_human_intervention", False))
+            is_followup = bool(parsed.get("is_followup", False))
+            followup_ctx = str(parsed.get("followup_context") or "")
+            answerable = bool(parsed.get("answerable_from_context", True))
+
+        return GeneratedResponse.model_construct(
+            text=str(parsed["response_text"] or ""),
+            confidence=float(parsed["confidence"]),
+            reasoning=str(parsed.get("reasoning") or ""),
+            requires_human_intervention=requires_human,
+            is_followup=is_followup,
+            followup_context=followup_ctx,
+            answerable_from_context=answerable,
+        )
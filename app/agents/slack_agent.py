@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 
 from app.agents.base import BaseAgent
 
+# Static parts of the review message, shared by every request.  The Slack
+# SDK only serializes blocks, so these are never mutated.
+_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "AI Response Review Required",
+    },
+}
+_DIVIDER_BLOCK = {"type": "divider"}
+_APPROVE_TEXT = {"type": "plain_text", "text": "Approve and Send"}
+_EDIT_TEXT = {"type": "plain_text", "text": "Edit Response"}
+_REJECT_TEXT = {"type": "plain_text", "text": "Reject"}
+
 
 class SlackAgent(BaseAgent):
     """Handles all Slack-related interactions.
@@ -35,6 +49,10 @@ class SlackAgent(BaseAgent):
         mode = "mock" if self.mock_mode else "real"
         self.logger.info("Slack agent initialized (%s)", mode)
 
+    async def warm_up(self) -> None:
+        if self.client is not None:
+            await self.client.auth_test()
+
     async def send_review_request(
         self,
         conversation_id: str,
@@ -87,29 +105,23 @@ class SlackAgent(BaseAgent):
         reasoning: str,
         user_id: str = "",
     ) -> list[dict]:
-        approve_value = json.dumps({
+        approve_value = orjson.dumps({
             "conversation_id": conversation_id,
             "response_text": ai_response,
             "user_id": user_id,
             "reasoning": reasoning,
-        })
-        edit_value = json.dumps({
+        }).decode()
+        edit_value = orjson.dumps({
             "conversation_id": conversation_id,
             "response_text": ai_response,
             "user_id": user_id,
-        })
-        reject_value = json.dumps({
+        }).decode()
+        reject_value = orjson.dumps({
             "conversation_id": conversation_id,
-        })
+        }).decode()
 
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "AI Response Review Required",
-                },
-            },
+            _HEADER_BLOCK,
             {
                 "type": "section",
                 "text": {
@@ -130,7 +142,7 @@ class SlackAgent(BaseAgent):
                     },
                 ],
             },
-            {"type": "divider"},
+            _DIVIDER_BLOCK,
             {
                 "type": "section",
                 "text": {
@@ -138,7 +150,7 @@ class SlackAgent(BaseAgent):
                     "text": f"*Suggested Response:*\n{ai_response}",
                 },
             },
-            {"type": "divider"},
+            _DIVIDER_BLOCK,
             {
                 "type": "section",
                 "text": {
@@ -151,20 +163,20 @@ class SlackAgent(BaseAgent):
                 "elements": [
                     {
                         "type": "button",
-                        "text": {"type": "plain_text", "text": "Approve and Send"},
+                        "text": _APPROVE_TEXT,
                         "style": "primary",
                         "action_id": "approve_response",
                         "value": approve_value,
                     },
                     {
                         "type": "button",
-                        "text": {"type": "plain_text", "text": "Edit Response"},
+                        "text": _EDIT_TEXT,
                         "action_id": "edit_response",
                         "value": edit_value,
                     },
                     {
                         "type": "button",
-                        "text": {"type": "plain_text", "text": "Reject"},
+                        "text": _REJECT_TEXT,
                         "style": "danger",
                         "action_id": "reject_response",
                         "value": reject_value,
@@ -10,6 +10,9 @@ Values can be overridden via environment variables prefixed with ``COMPANY_``
 
 from __future__ import annotations
 
+import sys
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -129,6 +132,54 @@ class CompanyConfig(BaseSettings):
         "raw.githubusercontent.com",
     ]
 
+    # ── Derived prompt fragments ──
+    # The system and post-processor prompts shout product context in upper
+    # case. These are computed once per config instead of on every build.
+
+    @cached_property
+    def name_upper(self) -> str:
+        return sys.intern(self.name.upper())
+
+    @cached_property
+    def name_alias_upper(self) -> str:
+        return sys.intern(self.name_alias.upper())
+
+    @cached_property
+    def support_platform_name_upper(self) -> str:
+        return sys.intern(self.support_platform_name.upper())
+
+    @cached_property
+    def product_description_upper(self) -> str:
+        return sys.intern(self.product_description.upper())
+
+    @cached_property
+    def product_features_block(self) -> str:
+        return sys.intern("\n".join(f"* {f.upper()}" for f in self.product_features))
+
+    @cached_property
+    def sub_products_block(self) -> str:
+        return sys.intern("\n\n".join(p.upper() for p in self.sub_products))
+
+    @cached_property
+    def post_processor_extra_rules_upper(self) -> str:
+        return sys.intern("\n\n".join(r.upper() for r in self.post_processor_extra_rules))
+
+    @cached_property
+    def example_product_ref(self) -> str:
+        """Product reference used in the non-fabrication policy example, e.g.
+        ``Mem0/OpenMemory`` (name plus the first sub-product's name)."""
+        if self.sub_products and " is " in self.sub_products[0]:
+            first_sub = self.sub_products[0].split(" is ")[0]
+            if first_sub:
+                return f"{self.name}/{first_sub}"
+        return self.name
+
+    @cached_property
+    def faq_block(self) -> str:
+        return sys.intern(
+            "\n\n".join(f"{e.question.upper()}\n{e.answer}" for e in self.faq_entries)
+        )
+
     model_config = {"env_prefix": "COMPANY_", "env_file": ".env", "extra": "ignore"}
 
 
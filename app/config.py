@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     # Mem0
     MEM0_API_KEY: str = ""
     MEM0_GLOBAL_USER_ID: str = "global_catalogue"
+    # Short-lived cache for repeated searches (0 disables)
+    MEM0_SEARCH_CACHE_TTL_SECONDS: float = 60.0
+    MEM0_SEARCH_CACHE_MAX_ENTRIES: int = 1024
 
     # Slack
     SLACK_BOT_TOKEN: str = ""
@@ -59,9 +62,24 @@ class Settings(BaseSettings):
     # Post-Processor
     POST_PROCESSOR_ENABLED: bool = True
     POST_PROCESSOR_MODEL: str = "gpt-5-mini"
+    # Output cap (includes reasoning tokens on gpt-5 models) and reasoning
+    # effort; leave the effort empty for non-reasoning models.
+    POST_PROCESSOR_MAX_COMPLETION_TOKENS: int = 4096
+    POST_PROCESSOR_REASONING_EFFORT: str = "low"
+
+    # Semantic response cache (reuse answers for near-duplicate questions)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = 0.92
+    RESPONSE_CACHE_TTL_SECONDS: float = 3600.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
 
     # Message buffering (multi-turn rapid messages)
     MESSAGE_BUFFER_TIMEOUT_SECONDS: float = 3.0
+    # Shorter window when a lone message already reads as complete
+    MESSAGE_BUFFER_QUICK_TIMEOUT_SECONDS: float = 0.3
+    # Flush immediately once this many characters are buffered
+    MESSAGE_BUFFER_MAX_CHARS: int = 2000
 
     # Mock / Development
     MOCK_MODE: bool = False
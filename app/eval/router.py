@@ -4,14 +4,18 @@ candidate responses, review/edit/approve, and send back via Intercom."""
 import asyncio
 import json as json_mod
 import logging
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException, Request
+from openai import AsyncOpenAI
 from pydantic import BaseModel
 from starlette.responses import StreamingResponse
 
 from app.chat.trace import TraceCollector
+from app.config import settings
 from app.models.schemas import RoutingDecision
 from app.services.sync_service import extract_messages
 from app.utils.trace_utils import safe_serialize_trace
@@ -78,6 +82,12 @@ def _get_intercom_orchestrator(request: Request):
     return request.app.state.orchestrator
 
 
+@lru_cache(maxsize=1)
+def _get_openai_client() -> AsyncOpenAI:
+    """Shared OpenAI client for the translate/refine helpers (built on first use)."""
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+
 @router.post("/conversations")
 async def fetch_conversations(request: Request, body: FetchRequest = FetchRequest()):
     """Fetch recent Intercom conversations (both answered and unanswered)."""
@@ -441,6 +451,28 @@ async def generate_all_stream(request: Request, body: GenerateAllRequest):
     )
 
 
+def _intercom_error_detail(exc: httpx.HTTPStatusError) -> str:
+    """Pull a human-readable message out of an Intercom error response.
+
+    Parses the raw body once with orjson; falls back to the response text
+    when the body is not a JSON object.
+    """
+    try:
+        error_body = orjson.loads(exc.response.content)
+    except orjson.JSONDecodeError:
+        return exc.response.text or str(exc)
+    if not isinstance(error_body, dict):
+        return exc.response.text or str(exc)
+    return error_body.get("message") or next(
+        (
+            e["message"]
+            for e in error_body.get("errors") or []
+            if isinstance(e, dict) and e.get("message")
+        ),
+        str(exc),
+    )
+
+
 @router.post("/send")
 async def send_response(request: Request, body: SendRequest):
     """Send an approved/edited response to Intercom."""
@@ -476,11 +508,7 @@ async def send_response(request: Request, body: SendRequest):
 
     except httpx.HTTPStatusError as exc:
         status = exc.response.status_code
-        try:
-            error_body = exc.response.json()
-            detail = error_body.get("message") or error_body.get("errors", [{}])[0].get("message", str(exc))
-        except Exception:
-            detail = exc.response.text or str(exc)
+        detail = _intercom_error_detail(exc)
         logger.error(
             "Intercom API error %d for conversation %s: %s",
             status, body.conversation_id, detail,
@@ -497,14 +525,10 @@ async def send_response(request: Request, body: SendRequest):
 @router.post("/translate")
 async def translate_text(body: TranslateRequest):
     """Translate text to a target language using OpenAI."""
-    from openai import AsyncOpenAI
-
-    from app.config import settings
-
     if not settings.OPENAI_API_KEY:
         raise HTTPException(status_code=400, detail="OpenAI API key not configured")
 
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _get_openai_client()
 
     try:
         response = await client.chat.completions.create(
@@ -535,14 +559,10 @@ async def translate_text(body: TranslateRequest):
 @router.post("/refine")
 async def refine_response(body: RefineRequest):
     """Refine a low-confidence response based on user instructions."""
-    from openai import AsyncOpenAI
-
-    from app.config import settings
-
     if not settings.OPENAI_API_KEY:
         raise HTTPException(status_code=400, detail="OpenAI API key not configured")
 
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _get_openai_client()
 
     system_prompt = (
         "You are a support response refinement agent. You will receive:\n"
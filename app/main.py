@@ -1,11 +1,27 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.responses import ORJSONResponse
+
+from app.agents import (
+    DocAgent,
+    MemZeroAgent,
+    MemoryAgent,
+    OrchestratorAgent,
+    PostProcessingAgent,
+    PreCheckAgent,
+    ResponseAgent,
+    SlackAgent,
+)
 from app.company import company_config
 from app.config import settings
+from app.services.message_coordinator import MessageCoordinator
+from app.services.response_cache import SemanticResponseCache
+from app.services.sync_service import SyncService
 from app.webhooks.intercom import router as intercom_router
 from app.webhooks import intercom as intercom_webhook
 
@@ -20,44 +36,59 @@ except ImportError:
 logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long startup waits for upstream connection warm-up.
+_WARM_UP_TIMEOUT = 5.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from app.agents import (
-        DocAgent,
-        MemZeroAgent,
-        MemoryAgent,
-        PreCheckAgent,
-        ResponseAgent,
-        PostProcessingAgent,
-        SlackAgent,
-        OrchestratorAgent,
+    # Read hot settings once; they are referenced throughout agent wiring.
+    openai_key = settings.OPENAI_API_KEY
+    mock_mode = settings.MOCK_MODE
+
+    # One pooled HTTP client shared by every agent that talks plain HTTP
+    # (Intercom API, documentation fetches) so connections are reused.
+    # HTTP/2 multiplexes concurrent requests to the same host over one
+    # connection; keep-alive is long enough to span quiet periods.
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
     )
+    app.state.http = http_client
 
     # --- Agents (own SDK clients directly, no service layer) ---
 
     memzero_agent = MemZeroAgent(
         api_key=settings.MEM0_API_KEY,
         global_user_id=settings.MEM0_GLOBAL_USER_ID,
+        search_cache_ttl=settings.MEM0_SEARCH_CACHE_TTL_SECONDS,
+        search_cache_max_entries=settings.MEM0_SEARCH_CACHE_MAX_ENTRIES,
     )
     memory_agent = MemoryAgent(memzero_agent=memzero_agent)
 
     # Skill Agent: LLM-driven agent that reads skill documentation to answer
     # technical questions the primary AI can't handle from memory alone
     skill_agent = None
-    if settings.SKILL_AGENT_ENABLED and settings.OPENAI_API_KEY:
+    if settings.SKILL_AGENT_ENABLED and openai_key:
         from skill_consumer import SkillAgent
         from skill_consumer.config import SkillAgentConfig
 
         skill_agent = SkillAgent(
-            openai_api_key=settings.OPENAI_API_KEY,
+            openai_api_key=openai_key,
             config=SkillAgentConfig(
                 router_model=settings.SKILL_AGENT_ROUTER_MODEL,
                 synthesis_model=settings.SKILL_AGENT_SYNTHESIS_MODEL,
                 max_iterations=settings.SKILL_AGENT_MAX_ITERATIONS,
                 skills_dir="skills",
             ),
+            http_client=http_client,
         )
+        await skill_agent.initialize()
         logger.info("Skill agent initialized (router=%s, synthesis=%s)",
                      settings.SKILL_AGENT_ROUTER_MODEL,
                      settings.SKILL_AGENT_SYNTHESIS_MODEL)
@@ -66,15 +97,16 @@ async def lifespan(app: FastAPI):
 
     # Doc Agent: searches Mintlify documentation before falling back to SkillAgent
     doc_agent = None
-    if settings.DOC_AGENT_ENABLED and settings.OPENAI_API_KEY:
+    if settings.DOC_AGENT_ENABLED and openai_key:
         doc_agent = DocAgent(
-            api_key=settings.OPENAI_API_KEY,
+            api_key=openai_key,
             mintlify_url=settings.DOC_AGENT_MINTLIFY_URL,
             product_description=settings.DOC_AGENT_PRODUCT_DESCRIPTION,
             model=settings.DOC_AGENT_MODEL,
             confidence_threshold=settings.DOC_AGENT_CONFIDENCE_THRESHOLD,
             skill_agent=skill_agent,
             max_results=settings.DOC_AGENT_MAX_RESULTS,
+            http_client=http_client,
         )
         await doc_agent.initialize()
         logger.info("Doc agent initialized (url=%s, model=%s)",
@@ -86,7 +118,7 @@ async def lifespan(app: FastAPI):
     fallback_agent = doc_agent or skill_agent
 
     response_agent = ResponseAgent(
-        api_key=settings.OPENAI_API_KEY,
+        api_key=openai_key,
         model=settings.OPENAI_MODEL,
         skill_agent=fallback_agent,
         confidence_threshold=settings.CONFIDENCE_THRESHOLD,
@@ -94,9 +126,9 @@ async def lifespan(app: FastAPI):
 
     # Pre-check agent: fast classifier that routes before answer generation
     precheck_agent = None
-    if settings.PRE_CHECK_ENABLED and settings.OPENAI_API_KEY:
+    if settings.PRE_CHECK_ENABLED and openai_key:
         precheck_agent = PreCheckAgent(
-            api_key=settings.OPENAI_API_KEY,
+            api_key=openai_key,
             model=settings.PRE_CHECK_MODEL,
             company_cfg=company_config,
         )
@@ -106,9 +138,12 @@ async def lifespan(app: FastAPI):
 
     # Post-processing agent: pass api_key only when enabled
     postprocessing_agent = PostProcessingAgent(
-        api_key=settings.OPENAI_API_KEY if settings.POST_PROCESSOR_ENABLED else None,
+        api_key=openai_key if settings.POST_PROCESSOR_ENABLED else None,
         model=settings.POST_PROCESSOR_MODEL,
         company_cfg=company_config,
+        max_completion_tokens=settings.POST_PROCESSOR_MAX_COMPLETION_TOKENS,
+        reasoning_effort=settings.POST_PROCESSOR_REASONING_EFFORT,
+        confidence_threshold=settings.CONFIDENCE_THRESHOLD,
     )
     if postprocessing_agent.is_enabled:
         logger.info("Post-processing agent enabled (model=%s)", settings.POST_PROCESSOR_MODEL)
@@ -116,28 +151,52 @@ async def lifespan(app: FastAPI):
         logger.info("Post-processing agent disabled")
 
     slack_agent = SlackAgent(
-        bot_token=settings.SLACK_BOT_TOKEN if not settings.MOCK_MODE else "",
+        bot_token=settings.SLACK_BOT_TOKEN if not mock_mode else "",
         channel_id=settings.SLACK_CHANNEL_ID,
-        mock_mode=settings.MOCK_MODE,
+        mock_mode=mock_mode,
     )
 
+    # Semantic response cache: skips answer generation for near-duplicate questions
+    response_cache = None
+    if settings.RESPONSE_CACHE_ENABLED and openai_key:
+        response_cache = SemanticResponseCache(
+            api_key=openai_key,
+            model=settings.RESPONSE_CACHE_EMBEDDING_MODEL,
+            similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        )
+        logger.info(
+            "Response cache enabled (model=%s, threshold=%.2f)",
+            settings.RESPONSE_CACHE_EMBEDDING_MODEL,
+            settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+        )
+    else:
+        logger.info("Response cache disabled")
+
     orchestrator = OrchestratorAgent(
         memory_agent=memory_agent,
         response_agent=response_agent,
         postprocessing_agent=postprocessing_agent,
         slack_agent=slack_agent,
         precheck_agent=precheck_agent,
-        intercom_access_token=settings.INTERCOM_ACCESS_TOKEN if not settings.MOCK_MODE else "",
+        intercom_access_token=settings.INTERCOM_ACCESS_TOKEN if not mock_mode else "",
         intercom_admin_id=settings.INTERCOM_ADMIN_ID,
-        mock_mode=settings.MOCK_MODE,
+        mock_mode=mock_mode,
         confidence_threshold=settings.CONFIDENCE_THRESHOLD,
+        response_cache=response_cache,
+        http_client=http_client,
     )
 
     await orchestrator.initialize()
 
-    # Sync service uses a REAL (non-mock) OrchestratorAgent for data fetching
-    from app.services.sync_service import SyncService
+    # Pre-open TLS connections so the first webhook only pays for the LLM.
+    try:
+        await asyncio.wait_for(orchestrator.warm_up(), timeout=_WARM_UP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Connection warm-up timed out after %.0fs", _WARM_UP_TIMEOUT)
 
+    # Sync service uses a REAL (non-mock) OrchestratorAgent for data fetching
     sync_service = None
 
     if settings.INTERCOM_ACCESS_TOKEN:
@@ -151,6 +210,7 @@ async def lifespan(app: FastAPI):
             intercom_admin_id=settings.INTERCOM_ADMIN_ID,
             mock_mode=False,
             confidence_threshold=settings.CONFIDENCE_THRESHOLD,
+            http_client=http_client,
         )
         sync_service = SyncService(
             orchestrator=sync_orchestrator,
@@ -165,11 +225,11 @@ async def lifespan(app: FastAPI):
         logger.warning("No INTERCOM_ACCESS_TOKEN — sync disabled")
 
     # Message coordinator: buffers rapid consecutive messages per conversation
-    from app.services.message_coordinator import MessageCoordinator
-
     coordinator = MessageCoordinator(
         orchestrator=orchestrator,
         timeout=settings.MESSAGE_BUFFER_TIMEOUT_SECONDS,
+        quick_timeout=settings.MESSAGE_BUFFER_QUICK_TIMEOUT_SECONDS,
+        max_buffered_chars=settings.MESSAGE_BUFFER_MAX_CHARS,
     )
     logger.info(
         "Message coordinator initialized (buffer_timeout=%.1fs)",
@@ -194,12 +254,14 @@ async def lifespan(app: FastAPI):
         await doc_agent.shutdown()
     if sync_orchestrator:
         await sync_orchestrator.close()
+    await http_client.aclose()
     logger.info("Shutdown complete")
 
 
 api = FastAPI(
     title=f"{company_config.name} {company_config.support_platform_name} Auto-Responder",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 api.add_middleware(
     CORSMiddleware,
@@ -226,7 +288,7 @@ if _slack_available:
         return await slack_handler.handle(req)
 
 
-@api.post("/sync")
+@api.post("/sync", status_code=202)
 async def sync_conversations(request: Request, background_tasks: BackgroundTasks):
     """Fetch Intercom conversations, save locally, and ingest into Mem0."""
     sync_service = request.app.state.sync_service
@@ -242,7 +304,7 @@ async def sync_conversations(request: Request, background_tasks: BackgroundTasks
     }
 
 
-@api.post("/sync-local")
+@api.post("/sync-local", status_code=202)
 async def sync_from_local(request: Request, background_tasks: BackgroundTasks):
     """Re-ingest conversations from the local JSON file into Mem0."""
     sync_service = request.app.state.sync_service
@@ -1,6 +1,7 @@
+from dataclasses import dataclass, field
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class QuestionType(str, Enum):
@@ -44,23 +45,35 @@ class GeneratedResponse(BaseModel):
     followup_context: str = ""
     answerable_from_context: bool = True
 
+    model_config = {"frozen": True}
+
 
 class ContactInfo(BaseModel):
     id: str = ""
     name: str = ""
     email: str = ""
 
+    model_config = {"frozen": True}
+
+
+@dataclass(slots=True)
+class PostProcessorInput:
+    """Internal DTO handed to the post-processor (never crosses an API
+    boundary, so it skips pydantic validation)."""
 
-class PostProcessorInput(BaseModel):
     customer_message: str
     generated_response: str
     original_confidence: float
     original_reasoning: str = ""
-    conversation_history: list[dict] = []
+    conversation_history: list[dict] = field(default_factory=list)
+
 
+@dataclass(frozen=True, slots=True)
+class PostProcessorOutput:
+    """Internal DTO parsed from the post-processor LLM output; the producer
+    clamps ``final_confidence`` to [0, 1]."""
 
-class PostProcessorOutput(BaseModel):
     refined_text: str
-    final_confidence: float = Field(ge=0.0, le=1.0)
+    final_confidence: float = 0.0
     reasoning: str = ""
     response_addresses_question: bool = True
@@ -10,12 +10,22 @@ edit this file to change the *structure* of the system prompt.
 
 from __future__ import annotations
 
+import weakref
+
 from app.company import CompanyConfig, company_config
 
+# id(config) -> (weakref to that config, built prompt).  CompanyConfig is not
+# hashable, so the weakref guards against a recycled id() after the original
+# config object has been garbage-collected.
+_prompt_cache: dict[int, tuple[weakref.ref[CompanyConfig], str]] = {}
+
 
 def build_system_prompt(config: CompanyConfig | None = None) -> str:
     """Build the full system prompt from company configuration.
 
+    The result is memoized per config object, so repeated calls with the
+    same config return the same interned string without re-assembling it.
+
     Parameters
     ----------
     config:
@@ -24,23 +34,17 @@ def build_system_prompt(config: CompanyConfig | None = None) -> str:
     """
     cfg = config or company_config
 
-    product_features_block = "\n".join(f"* {f.upper()}" for f in cfg.product_features)
-    sub_products_block = "\n\n".join(p.upper() for p in cfg.sub_products)
+    cached = _prompt_cache.get(id(cfg))
+    if cached is not None and cached[0]() is cfg:
+        return cached[1]
 
-    faq_block = ""
-    for entry in cfg.faq_entries:
-        faq_block += f"{entry.question.upper()}\n{entry.answer}\n\n"
-    faq_block = faq_block.rstrip()
+    prompt = _render_system_prompt(cfg)
+    _prompt_cache[id(cfg)] = (weakref.ref(cfg), prompt)
+    return prompt
 
-    # Build the example product reference (used in the non-fabrication policy
-    # section so the LLM knows how to behave when asked about integrations).
-    example_product_ref = cfg.name
-    if cfg.sub_products:
-        # Extract the first sub-product name for the example.
-        first_sub = cfg.sub_products[0].split(" is ")[0] if " is " in cfg.sub_products[0] else ""
-        if first_sub:
-            example_product_ref = f"{cfg.name}/{first_sub}"
 
+def _render_system_prompt(cfg: CompanyConfig) -> str:
+    """Assemble the system prompt text for *cfg* (uncached)."""
     return f"""\
 You are a friendly and professional customer support agent responding to users on {cfg.support_platform_name}.
 
@@ -89,13 +93,13 @@ IF IT IS NOT CLEARLY SUPPORTED BY THE PROVIDED INFORMATION, DO NOT RESPOND.
 
 ## PRODUCT CONTEXT (FOR INTERNAL REFERENCE ONLY)
 
-{cfg.name.upper()} ({cfg.name_alias.upper()}) IS {cfg.product_description.upper()}.
+{cfg.name_upper} ({cfg.name_alias_upper}) IS {cfg.product_description_upper}.
 
 IT PROVIDES:
 
-{product_features_block}
+{cfg.product_features_block}
 
-{sub_products_block}
+{cfg.sub_products_block}
 
 THIS IS THE FULL EXTENT OF PRODUCT INFORMATION AVAILABLE.
 
@@ -114,7 +118,7 @@ NO OTHER IMPLEMENTATION DETAILS EXIST UNLESS PROVIDED IN MEMORY OR FAQ.
 * DO NOT ASK CLARIFICATION QUESTIONS TO COVER KNOWLEDGE GAPS.
 
 IF A USER ASKS:
-"How do I integrate {example_product_ref} with Antigravity?"
+"How do I integrate {cfg.example_product_ref} with Antigravity?"
 
 AND THERE ARE NO INTEGRATION STEPS PROVIDED IN THE KNOWLEDGE BASE OR MEMORY:
 
@@ -158,7 +162,7 @@ IF RETURNING EMPTY, DO NOT ADD ANY TEXT.
 
 ## FAQ KNOWLEDGE BASE
 
-{faq_block}
+{cfg.faq_block}
 
 ---
 
@@ -191,7 +195,12 @@ FIELD DESCRIPTIONS:
 """
 
 
-# Module-level constant for backward compatibility.
-# Consumers that import ``SYSTEM_PROMPT`` directly will get the prompt
-# built with the default company config.
-SYSTEM_PROMPT: str = build_system_prompt()
+def __getattr__(name: str) -> str:
+    # ``SYSTEM_PROMPT`` is kept for backward compatibility: consumers that
+    # import it directly get the prompt built with the default company
+    # config.  It is built on first access rather than at import time.
+    if name == "SYSTEM_PROMPT":
+        global SYSTEM_PROMPT
+        SYSTEM_PROMPT = build_system_prompt()
+        return SYSTEM_PROMPT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,12 @@ and re-exports SYSTEM_PROMPT for callers.
 
 from __future__ import annotations
 
-from app.prompt import SYSTEM_PROMPT
+from app import prompt as _prompt
+from app.prompt import build_system_prompt
+
+_HISTORY_HEADER = "--- Previous conversation turns ---"
+_MEMORIES_HEADER = "--- Relevant knowledge base entries ---"
+_MESSAGE_HEADER = "--- Customer's current message ---"
 
 
 def build_user_prompt(
@@ -30,17 +35,24 @@ def build_user_prompt(
         parts.append(f"Customer: {contact_info.name} ({contact_info.email})")
 
     if conversation_history:
-        parts.append("--- Previous conversation turns ---")
-        for mem in conversation_history:
-            parts.append(mem.get("memory", ""))
+        parts.append(_HISTORY_HEADER)
+        parts.extend(mem.get("memory", "") for mem in conversation_history)
 
     if relevant_memories:
-        parts.append("--- Relevant knowledge base entries ---")
-        for mem in relevant_memories:
-            score = mem.get("score", 0)
-            parts.append(f"[relevance: {score:.2f}] {mem.get('memory', '')}")
+        parts.append(_MEMORIES_HEADER)
+        parts.extend(
+            f"[relevance: {mem.get('score', 0):.2f}] {mem.get('memory', '')}"
+            for mem in relevant_memories
+        )
 
-    parts.append("--- Customer's current message ---")
+    parts.append(_MESSAGE_HEADER)
     parts.append(customer_message)
 
     return "\n\n".join(parts)
+
+
+def __getattr__(name: str) -> str:
+    # Forward lazily so importing this module does not build the prompt.
+    if name == "SYSTEM_PROMPT":
+        return _prompt.SYSTEM_PROMPT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
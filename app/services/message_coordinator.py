@@ -11,13 +11,20 @@ The coordinator solves this by:
 3. Once the timer expires (no new messages within the window), it combines
    all buffered messages and forwards the batch to the orchestrator as a
    single unified message.
+
+The window is shortened when waiting is unlikely to pay off: a single
+message that ends like a finished sentence uses ``quick_timeout``, and a
+buffer that has grown past ``max_buffered_chars`` is flushed right away.
+
+At most ``max_conversations`` buffers are held at once; when a new
+conversation would exceed that, the oldest buffer is flushed early rather
+than dropped.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -28,22 +35,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class _BufferedMessage:
-    """A single message waiting in the buffer."""
-
-    body: str
-    timestamp: float
+# A lone message ending in one of these reads as a complete thought.
+_SENTENCE_END = (".", "?", "!")
 
 
 @dataclass
 class _ConversationBuffer:
     """Per-conversation state used by the coordinator."""
 
-    messages: list[_BufferedMessage] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
     contact_info: ContactInfo | None = None
     user_id: str = ""
+    total_chars: int = 0
     timer_task: asyncio.Task | None = None  # type: ignore[type-arg]
 
 
@@ -61,13 +64,19 @@ class MessageCoordinator:
         self,
         orchestrator: OrchestratorAgent,
         timeout: float = 3.0,
+        quick_timeout: float = 0.3,
+        max_buffered_chars: int = 2000,
+        max_conversations: int = 10_000,
     ) -> None:
         self._orchestrator = orchestrator
         self._timeout = timeout
-        # conversation_id -> buffer
+        self._quick_timeout = min(quick_timeout, timeout)
+        self._max_buffered_chars = max_buffered_chars
+        self._max_conversations = max_conversations
+        # conversation_id -> buffer, oldest first.  Every read-modify-write
+        # of a buffer below runs without an ``await``, so it is atomic on the
+        # event loop and needs no per-conversation lock.
         self._buffers: dict[str, _ConversationBuffer] = {}
-        # Per-conversation lock to prevent race conditions
-        self._locks: dict[str, asyncio.Lock] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -80,50 +89,69 @@ class MessageCoordinator:
         contact_info: ContactInfo | None = None,
         user_id: str = "",
     ) -> None:
-        """Add a message to the buffer and (re)start the debounce timer."""
-        lock = self._get_lock(conversation_id)
-        async with lock:
-            buf = self._buffers.get(conversation_id)
-            if buf is None:
-                buf = _ConversationBuffer(contact_info=contact_info, user_id=user_id)
-                self._buffers[conversation_id] = buf
-
-            buf.messages.append(
-                _BufferedMessage(body=message_body, timestamp=time.monotonic())
-            )
-            # Always keep the latest contact_info / user_id
-            if contact_info:
-                buf.contact_info = contact_info
-            if user_id:
-                buf.user_id = user_id
-
-            # Cancel any pending timer so we restart the debounce window.
-            if buf.timer_task is not None and not buf.timer_task.done():
-                buf.timer_task.cancel()
-
-            buf.timer_task = asyncio.create_task(
-                self._debounce_then_flush(conversation_id)
-            )
+        """Add a message to the buffer and (re)start the debounce timer.
+
+        Never waits on processing: the pipeline runs in the timer task, so
+        webhook handlers can await this and still acknowledge immediately.
+        """
+        buf = self._buffers.get(conversation_id)
+        if buf is None:
+            if len(self._buffers) >= self._max_conversations:
+                self._evict_oldest()
+            buf = _ConversationBuffer(contact_info=contact_info, user_id=user_id)
+            self._buffers[conversation_id] = buf
+
+        buf.messages.append(message_body)
+        buf.total_chars += len(message_body)
+        # Always keep the latest contact_info / user_id
+        if contact_info:
+            buf.contact_info = contact_info
+        if user_id:
+            buf.user_id = user_id
+
+        # Cancel any pending timer so we restart the debounce window.
+        if buf.timer_task is not None and not buf.timer_task.done():
+            buf.timer_task.cancel()
+
+        buf.timer_task = asyncio.create_task(
+            self._debounce_then_flush(conversation_id, self._flush_delay(buf))
+        )
 
-            logger.info(
-                "Buffered message for conversation %s (%d message(s) pending)",
-                conversation_id,
-                len(buf.messages),
-            )
+        logger.info(
+            "Buffered message for conversation %s (%d message(s) pending)",
+            conversation_id,
+            len(buf.messages),
+        )
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
-    def _get_lock(self, conversation_id: str) -> asyncio.Lock:
-        if conversation_id not in self._locks:
-            self._locks[conversation_id] = asyncio.Lock()
-        return self._locks[conversation_id]
+    def _flush_delay(self, buf: _ConversationBuffer) -> float:
+        """Debounce window for the buffer's current contents."""
+        if buf.total_chars >= self._max_buffered_chars:
+            return 0.0
+        if len(buf.messages) == 1 and buf.messages[0].rstrip().endswith(_SENTENCE_END):
+            return self._quick_timeout
+        return self._timeout
+
+    def _evict_oldest(self) -> None:
+        """Flush the oldest buffer now to make room for a new conversation."""
+        conversation_id = next(iter(self._buffers))
+        buf = self._buffers.pop(conversation_id)
+        if buf.timer_task is not None and not buf.timer_task.done():
+            buf.timer_task.cancel()
+        logger.warning(
+            "Buffer limit (%d) reached, flushing conversation %s early",
+            self._max_conversations,
+            conversation_id,
+        )
+        buf.timer_task = asyncio.create_task(self._dispatch(conversation_id, buf))
 
-    async def _debounce_then_flush(self, conversation_id: str) -> None:
+    async def _debounce_then_flush(self, conversation_id: str, delay: float) -> None:
         """Wait for the debounce window then flush the buffer."""
         try:
-            await asyncio.sleep(self._timeout)
+            await asyncio.sleep(delay)
         except asyncio.CancelledError:
             # Timer was reset by a newer message — this is expected.
             return
@@ -132,29 +160,41 @@ class MessageCoordinator:
 
     async def _flush(self, conversation_id: str) -> None:
         """Combine buffered messages and forward to the orchestrator."""
-        lock = self._get_lock(conversation_id)
-        async with lock:
-            buf = self._buffers.pop(conversation_id, None)
-            # Also clean up the lock entry to avoid unbounded growth.
-            self._locks.pop(conversation_id, None)
+        buf = self._buffers.pop(conversation_id, None)
+
+        if buf is None:
+            return
+
+        await self._dispatch(conversation_id, buf)
 
-        if buf is None or not buf.messages:
+    async def _dispatch(self, conversation_id: str, buf: _ConversationBuffer) -> None:
+        """Forward an already-removed buffer to the orchestrator."""
+        # Intercom redelivers webhooks on 5xx, so the same text can be
+        # buffered twice; drop blanks and repeats, keeping first-seen order.
+        bodies = list(dict.fromkeys(b for b in (m.strip() for m in buf.messages) if b))
+        if not bodies:
             return
 
         # Build a single unified message from the buffered texts.
-        if len(buf.messages) == 1:
-            combined_body = buf.messages[0].body
-        else:
-            combined_body = "\n\n".join(m.body for m in buf.messages)
+        combined_body = "\n\n".join(bodies)
+        if len(bodies) > 1:
             logger.info(
                 "Combined %d buffered messages for conversation %s",
-                len(buf.messages),
+                len(bodies),
                 conversation_id,
             )
 
-        await self._orchestrator.handle_incoming_message(
-            conversation_id=conversation_id,
-            message_body=combined_body,
-            contact_info=buf.contact_info,
-            user_id=buf.user_id,
-        )
+        try:
+            await self._orchestrator.handle_incoming_message(
+                conversation_id=conversation_id,
+                message_body=combined_body,
+                contact_info=buf.contact_info,
+                user_id=buf.user_id,
+            )
+        except Exception:
+            # Nothing awaits the timer task, so log here rather than leave
+            # an unretrieved task exception.
+            logger.exception(
+                "Failed to process buffered messages for conversation %s",
+                conversation_id,
+            )
@@ -0,0 +1,177 @@
+"""Semantic Response Cache — reuses answers for near-duplicate questions.
+
+Many customer questions are rephrasings of the same thing ("how do I reset
+my password?" / "password reset?").  Running the full answer pipeline for
+each one costs several seconds of LLM latency and tokens.
+
+The cache embeds the customer message and compares it against previously
+answered messages.  A hit requires:
+1. Cosine similarity at or above the configured threshold, AND
+2. The same set of global catalogue matches, so an answer is never reused
+   after the knowledge base moved underneath it, AND
+3. The same customer (memory user id and name), since the prompt includes
+   their contact details and conversation history and answers may address
+   the customer personally.
+
+Entries are bucketed by (2) and (3), so a lookup only compares embeddings
+against answers that were built from the same context.
+
+Only confident, final (post-processed) responses are stored, and entries
+expire after a TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from openai import AsyncOpenAI
+
+from app.models.schemas import ContactInfo, GeneratedResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheKey:
+    """Lookup key for a single customer message."""
+
+    embedding: list[float]  # unit length, so cosine similarity is a dot product
+    context_digest: str
+
+
+@dataclass
+class _CacheEntry:
+    key: CacheKey
+    response: GeneratedResponse
+    expires_at: float
+
+
+def _context_digest(
+    global_matches: list[dict], contact_name: str = "", user_id: str = ""
+) -> str:
+    """Stable digest of the context a response was built from: the knowledge
+    base entries and the customer (memory user id and name) shown to the LLM."""
+    ids = sorted(str(m.get("id") or m.get("memory", "")) for m in global_matches)
+    ids.extend((contact_name, user_id))
+    return hashlib.sha1("\x1f".join(ids).encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticResponseCache:
+    """In-memory embedding cache keyed on customer message similarity.
+
+    Usage::
+
+        key = await cache.make_key(
+            message, memory_context.global_matches, contact_info, user_id
+        )
+        cached = cache.lookup(key)
+        if cached is None:
+            result = ...  # full pipeline
+            cache.store(key, result)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512,
+    ) -> None:
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self.threshold = similarity_threshold
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        # context digest -> entries built from that context.
+        self._buckets: dict[str, dict[int, _CacheEntry]] = {}
+        # entry id -> context digest, insertion-ordered so the oldest entry
+        # is evicted first.
+        self._order: OrderedDict[int, str] = OrderedDict()
+        self._next_id = 0
+
+    async def make_key(
+        self,
+        message: str,
+        global_matches: list[dict],
+        contact_info: ContactInfo | None = None,
+        user_id: str = "",
+    ) -> CacheKey | None:
+        """Embed the message; returns None if the embedding call fails."""
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model, input=message
+            )
+        except Exception:
+            logger.exception("Response cache embedding failed, bypassing cache")
+            return None
+
+        contact_name = contact_info.name if contact_info else ""
+        return CacheKey(
+            embedding=_normalize(response.data[0].embedding),
+            context_digest=_context_digest(global_matches, contact_name, user_id),
+        )
+
+    def lookup(self, key: CacheKey) -> GeneratedResponse | None:
+        """Return the cached response of the most similar live entry, if any."""
+        bucket = self._buckets.get(key.context_digest)
+        if not bucket:
+            return None
+
+        now = time.monotonic()
+        best: _CacheEntry | None = None
+        best_score = self.threshold
+
+        for entry_id, entry in list(bucket.items()):
+            if entry.expires_at <= now:
+                self._remove(entry_id)
+                continue
+            score = self._similarity(key, entry.key)
+            if score >= best_score:
+                best, best_score = entry, score
+
+        if best is None:
+            return None
+
+        logger.info("Response cache hit (similarity=%.3f)", best_score)
+        return best.response
+
+    def store(self, key: CacheKey, response: GeneratedResponse) -> None:
+        """Cache a final response, evicting the oldest entry when full."""
+        while len(self._order) >= self.max_entries:
+            self._remove(next(iter(self._order)))
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._order[entry_id] = key.context_digest
+        self._buckets.setdefault(key.context_digest, {})[entry_id] = _CacheEntry(
+            key=key,
+            response=response,
+            expires_at=time.monotonic() + self.ttl,
+        )
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _remove(self, entry_id: int) -> None:
+        digest = self._order.pop(entry_id)
+        bucket = self._buckets[digest]
+        del bucket[entry_id]
+        if not bucket:
+            del self._buckets[digest]
+
+    @staticmethod
+    def _similarity(a: CacheKey, b: CacheKey) -> float:
+        # Both embeddings are unit length, so the dot product is the cosine.
+        return sum(map(operator.mul, a.embedding, b.embedding))
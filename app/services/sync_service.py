@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import html
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
+
 from app.company import company_config
 
 if TYPE_CHECKING:
@@ -15,10 +19,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Turn markers used when formatting a conversation for the catalogue.
+_CUSTOMER_PREFIX = "Customer said: "
+_SUPPORT_PREFIX = "Support said: "
+# Largest page Intercom's list conversations endpoint returns.
+_MAX_LIST_PAGE_SIZE = 150
+# Upper bound on conversations handed to one Mem0 worker at a time.
+_INGEST_BATCH_SIZE = 32
+
 
 def strip_html(text: str) -> str:
-    """Remove HTML tags from Intercom message bodies."""
-    return re.sub(r"<[^>]+>", "", text).strip() if text else ""
+    """Remove HTML tags from Intercom message bodies and decode entities."""
+    return html.unescape(_HTML_TAG_RE.sub("", text)).strip() if text else ""
 
 
 # Keep the underscore alias for internal backward compatibility
@@ -39,32 +52,28 @@ def extract_messages(conv: dict) -> list[dict]:
     - Internal admin notes
     - System events (language detection, attribute updates, etc.)
     """
+    # Bind module globals to locals for the comprehension below, which runs
+    # once per conversation part during a sync.
+    allowed, customer, strip = _ALLOWED_PART_TYPES, _CUSTOMER_AUTHOR_TYPES, strip_html
+
     messages: list[dict] = []
 
     source = conv.get("source", {})
-    source_body = strip_html(source.get("body", ""))
+    source_body = strip(source.get("body", ""))
     source_author_type = source.get("author", {}).get("type", "")
 
     if source_body and source_author_type != "bot":
-        role = "user" if source_author_type in _CUSTOMER_AUTHOR_TYPES else "admin"
+        role = "user" if source_author_type in customer else "admin"
         messages.append({"role": role, "content": source_body})
 
     parts = conv.get("conversation_parts", {}).get("conversation_parts", [])
-    for part in parts:
-        if part.get("part_type") not in _ALLOWED_PART_TYPES:
-            continue
-
-        author_type = part.get("author", {}).get("type", "")
-        if author_type == "bot":
-            continue
-
-        body = strip_html(part.get("body", ""))
-        if not body:
-            continue
-
-        role = "user" if author_type in _CUSTOMER_AUTHOR_TYPES else "admin"
-        messages.append({"role": role, "content": body})
-
+    messages += [
+        {"role": "user" if author_type in customer else "admin", "content": body}
+        for part in parts
+        if part.get("part_type") in allowed
+        and (author_type := part.get("author", {}).get("type", "")) != "bot"
+        and (body := strip(part.get("body", "")))
+    ]
     return messages
 
 
@@ -77,6 +86,8 @@ class SyncService:
         max_messages_per_conversation: int = 5,
         max_conversation_chars: int = 3000,
         data_dir: str = "data",
+        fetch_concurrency: int = 10,
+        ingest_concurrency: int = 16,
     ):
         self.orchestrator = orchestrator
         self.memzero = memzero_agent
@@ -84,17 +95,21 @@ class SyncService:
         self.max_messages = max_messages_per_conversation
         self.max_chars = max_conversation_chars
         self.data_dir = Path(data_dir)
+        self._fetch_sem = asyncio.Semaphore(fetch_concurrency)
+        self.ingest_concurrency = ingest_concurrency
 
     async def sync_all_conversations(self) -> dict:
         """Three-phase sync: fetch from Intercom, save locally, ingest into Mem0."""
         # Phase 1: Fetch
         raw_conversations = await self._fetch_all_conversations()
 
-        # Phase 2: Save locally as JSON
-        self._save_to_json(raw_conversations)
+        # Phase 2: Save locally as JSON.  Encoding and writing a large dump
+        # would stall webhook handling, so it also runs in a worker thread.
+        await asyncio.to_thread(self._save_to_json, raw_conversations)
 
-        # Phase 3: Ingest into Mem0 global catalogue
-        return self._ingest_into_mem0(raw_conversations)
+        # Phase 3: Ingest into Mem0 global catalogue.  The Mem0 SDK is
+        # blocking, so run the (long) ingestion loop off the event loop.
+        return await asyncio.to_thread(self._ingest_into_mem0, raw_conversations)
 
     def sync_from_local_json(self, filepath: str | None = None) -> dict:
         """Re-ingest from a previously saved JSON file without hitting Intercom."""
@@ -102,8 +117,7 @@ class SyncService:
         if not path.exists():
             raise FileNotFoundError(f"No saved data at {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
 
         conversations = data.get("conversations", [])
         logger.info("Loaded %d conversations from %s", len(conversations), path)
@@ -114,44 +128,59 @@ class SyncService:
     async def _fetch_all_conversations(self) -> list[dict]:
         """Fetch up to max_conversations from Intercom, fully hydrated."""
         conversations: list[dict] = []
-        cursor: str | None = None
 
         logger.info(
             "Fetching up to %d conversations from Intercom...",
             self.max_conversations,
         )
 
+        per_page = max(1, min(_MAX_LIST_PAGE_SIZE, self.max_conversations))
+        page = await self.orchestrator.list_conversations(per_page=per_page)
         while len(conversations) < self.max_conversations:
-            page = await self.orchestrator.list_conversations(
-                per_page=20, starting_after=cursor
-            )
             summaries = page.get("conversations", [])
             if not summaries:
                 break
 
-            for summary in summaries:
-                if len(conversations) >= self.max_conversations:
-                    break
-                conv_id = summary["id"]
-                try:
-                    full_conv = await self.orchestrator.get_conversation(conv_id)
-                    conversations.append(full_conv)
-                except Exception:
-                    logger.exception(
-                        "Failed to fetch conversation %s, skipping", conv_id
+            # Request the next page while this page's conversations hydrate.
+            next_page = page.get("pages", {}).get("next") or {}
+            cursor = next_page.get("starting_after")
+            next_page_task = (
+                asyncio.create_task(
+                    self.orchestrator.list_conversations(
+                        per_page=per_page, starting_after=cursor
                     )
+                )
+                if cursor
+                else None
+            )
 
-            pages = page.get("pages", {})
-            next_page = pages.get("next")
-            if not next_page or not next_page.get("starting_after"):
-                break
-            cursor = next_page["starting_after"]
+            try:
+                remaining = self.max_conversations - len(conversations)
+                results = await asyncio.gather(
+                    *(self._hydrate(s["id"]) for s in summaries[:remaining])
+                )
+                conversations.extend(r for r in results if r is not None)
+                logger.info("Fetched %d conversations so far...", len(conversations))
 
-            logger.info("Fetched %d conversations so far...", len(conversations))
+                if next_page_task is None or len(conversations) >= self.max_conversations:
+                    break
+                page = await next_page_task
+            finally:
+                if next_page_task is not None and not next_page_task.done():
+                    next_page_task.cancel()
 
         logger.info("Total conversations fetched: %d", len(conversations))
         return conversations
 
+    async def _hydrate(self, conv_id: str) -> dict | None:
+        """Fetch one full conversation; None if the request fails."""
+        async with self._fetch_sem:
+            try:
+                return await self.orchestrator.get_conversation(conv_id)
+            except Exception:
+                logger.exception("Failed to fetch conversation %s, skipping", conv_id)
+                return None
+
     # ── Phase 2: Save ──
 
     def _save_to_json(self, conversations: list[dict]) -> Path:
@@ -159,17 +188,14 @@ class SyncService:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         filepath = self.data_dir / "intercom_conversations.json"
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    "count": len(conversations),
-                    "conversations": conversations,
-                },
-                f,
-                indent=2,
-                default=str,
-            )
+        payload = {
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "count": len(conversations),
+            "conversations": conversations,
+        }
+        filepath.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str)
+        )
 
         logger.info("Saved %d conversations to %s", len(conversations), filepath)
         return filepath
@@ -177,12 +203,17 @@ class SyncService:
     # ── Phase 3: Ingest ──
 
     def _ingest_into_mem0(self, conversations: list[dict]) -> dict:
-        """Format each conversation and store in Mem0 global catalogue."""
+        """Format each conversation and store in Mem0 global catalogue.
+
+        Formatting and filtering run first; the (blocking) Mem0 writes are
+        then spread over a pool of ``ingest_concurrency`` threads.
+        """
         ingested = 0
         skipped_oversized = 0
         skipped_empty = 0
         skipped_no_admin_reply = 0
         errors = 0
+        work: list[tuple[str, str]] = []
 
         for conv in conversations:
             conv_id = conv.get("id", "unknown")
@@ -216,19 +247,43 @@ class SyncService:
                     skipped_oversized += 1
                     continue
 
-                self.memzero.store_global_catalogue_conversation(
-                    formatted_conversation=formatted,
-                    conversation_id=conv_id,
-                )
-                ingested += 1
-
-                if ingested % 50 == 0:
-                    logger.info("Ingested %d conversations into Mem0...", ingested)
+                work.append((conv_id, formatted))
 
             except Exception:
                 logger.exception("Failed to ingest conversation %s", conv_id)
                 errors += 1
 
+        if work:
+            # Small enough batches to keep every worker busy.
+            size = min(_INGEST_BATCH_SIZE, -(-len(work) // self.ingest_concurrency))
+            batches = [work[i : i + size] for i in range(0, len(work), size)]
+            with ThreadPoolExecutor(
+                max_workers=self.ingest_concurrency,
+                thread_name_prefix="mem0-ingest",
+            ) as pool:
+                futures = {
+                    pool.submit(self.memzero.store_global_catalogue_conversations, batch): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception:
+                        logger.exception("Failed to ingest batch of %d conversations", len(batch))
+                        errors += len(batch)
+                        continue
+                    for (conv_id, _), exc in zip(batch, results):
+                        if exc is not None:
+                            logger.error(
+                                "Failed to ingest conversation %s",
+                                conv_id,
+                                exc_info=exc,
+                            )
+                            errors += 1
+                    ingested += results.count(None)
+                    logger.info("Ingested %d conversations into Mem0...", ingested)
+
         summary = {
             "conversations_ingested": ingested,
             "skipped_oversized": skipped_oversized,
@@ -250,9 +305,11 @@ class SyncService:
         self, messages: list[dict], conversation_id: str
     ) -> str:
         """Format messages into a single string with structured turn markers."""
-        platform = company_config.support_platform_name
-        lines = [f"{platform} conversation {conversation_id}:"]
-        for msg in messages:
-            prefix = "Customer said" if msg["role"] == "user" else "Support said"
-            lines.append(f"{prefix}: {msg['content']}")
-        return "\n".join(lines)
+        header = f"{company_config.support_platform_name} conversation {conversation_id}:"
+        return "\n".join((
+            header,
+            *(
+                (_CUSTOMER_PREFIX if msg["role"] == "user" else _SUPPORT_PREFIX) + msg["content"]
+                for msg in messages
+            ),
+        ))
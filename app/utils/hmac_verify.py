@@ -1,5 +1,12 @@
 import hashlib
 import hmac
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _keyed_sha1(webhook_secret: str) -> "hmac.HMAC":
+    """HMAC-SHA1 object with the key already set up; copy() before use."""
+    return hmac.new(webhook_secret.encode("utf-8"), None, hashlib.sha1)
 
 
 def verify_intercom_signature(
@@ -11,10 +18,11 @@ def verify_intercom_signature(
     if not signature_header or not signature_header.startswith("sha1="):
         return False
 
-    expected_sig = signature_header[5:]
-    computed = hmac.new(
-        webhook_secret.encode("utf-8"),
-        raw_body,
-        hashlib.sha1,
-    ).hexdigest()
-    return hmac.compare_digest(computed, expected_sig)
+    try:
+        expected = bytes.fromhex(signature_header[5:])
+    except ValueError:
+        return False
+
+    mac = _keyed_sha1(webhook_secret).copy()
+    mac.update(raw_body)
+    return hmac.compare_digest(mac.digest(), expected)
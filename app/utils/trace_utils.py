@@ -2,25 +2,39 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from app.chat.trace import TraceCollector
 
 logger = logging.getLogger(__name__)
 
+# Accept int keys like the stdlib encoder the trace is later rendered with.
+_PROBE_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 
 def safe_serialize_trace(trace: TraceCollector) -> list[dict]:
-    """Serialize trace events, dropping non-serializable ones gracefully."""
+    """Serialize trace events, dropping non-serializable ones gracefully.
+
+    The whole trace is probed in one encoder pass; events are only checked
+    one by one when that pass fails.
+    """
     pipeline_trace = trace.serialize()
+    try:
+        orjson.dumps(pipeline_trace, option=_PROBE_OPTIONS)
+        return pipeline_trace
+    except TypeError:
+        pass
+
     safe_trace: list[dict] = []
     for i, event in enumerate(pipeline_trace):
         try:
-            json.dumps(event)
+            orjson.dumps(event, option=_PROBE_OPTIONS)
             safe_trace.append(event)
-        except (TypeError, ValueError) as exc:
+        except TypeError as exc:
             logger.warning(
                 "Trace event %d (%s) not serializable: %s",
                 i,
@@ -0,0 +1,53 @@
+"""Small in-memory TTL + LRU cache."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Entries expire ``ttl_seconds`` after being stored; beyond
+    ``max_entries`` the least recently used entry is evicted.
+
+    A non-positive TTL disables the cache (``put`` is a no-op).
+    ``invalidate`` walks a snapshot of the keys, so it may be called from
+    worker threads while the event loop reads and writes.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        expires_at, value = hit
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches *predicate*."""
+        for key in list(self._entries):
+            if predicate(key):
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
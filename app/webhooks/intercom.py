@@ -1,12 +1,16 @@
+import hashlib
 import logging
-import re
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
 
 from app.config import settings
 from app.utils.hmac_verify import verify_intercom_signature
 from app.models.schemas import ContactInfo
+from app.services.sync_service import strip_html
 
 if TYPE_CHECKING:
     from app.agents.orchestrator_agent import OrchestratorAgent
@@ -15,6 +19,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_HANDLED_TOPICS = frozenset({"conversation.user.created", "conversation.user.replied"})
+_HANDLED_TOPIC_BYTES = tuple(t.encode() for t in _HANDLED_TOPICS)
+
+# Intercom retries deliveries it considers failed; remember recent messages
+# so a retry does not run the pipeline a second time. Retries rewrite
+# notification fields (delivery_attempts, first_sent_at), so the raw body
+# cannot be the key.
+_DELIVERY_TTL_SECONDS = 600.0
+_MAX_REMEMBERED_DELIVERIES = 4096
+_recent_deliveries: OrderedDict[bytes, float] = OrderedDict()
+
+
+def _is_duplicate_delivery(conversation_id: str, message_body: str) -> bool:
+    """Record this message; True if the same conversation delivered the
+    same message recently."""
+    now = time.monotonic()
+    while _recent_deliveries:
+        oldest, expires_at = next(iter(_recent_deliveries.items()))
+        if expires_at > now and len(_recent_deliveries) < _MAX_REMEMBERED_DELIVERIES:
+            break
+        del _recent_deliveries[oldest]
+
+    fingerprint = hashlib.blake2b(
+        f"{conversation_id}\x1f{message_body}".encode(), digest_size=16
+    ).digest()
+    if fingerprint in _recent_deliveries:
+        return True
+    _recent_deliveries[fingerprint] = now + _DELIVERY_TTL_SECONDS
+    return False
+
+
 orchestrator: "OrchestratorAgent | None" = None
 message_coordinator: "MessageCoordinator | None" = None
 
@@ -38,18 +73,22 @@ def _extract_latest_message(payload: dict) -> str:
             body = data.get("source", {}).get("body", "")
 
     # Strip HTML tags (Intercom sends HTML)
-    return re.sub(r"<[^>]+>", "", body).strip()
+    return strip_html(body)
 
 
 def _extract_contact_info(payload: dict) -> ContactInfo:
-    """Extract contact name and email from the payload."""
+    """Extract contact name and email from the payload.
+
+    Every field is coerced to ``str`` here (Intercom sends ``null`` for
+    unknown names and emails), so validation is skipped.
+    """
     data = payload.get("data", {}).get("item", {})
     source = data.get("source", {})
     author = source.get("author", {})
-    return ContactInfo(
-        id=str(author.get("id", "")),
-        name=author.get("name", ""),
-        email=author.get("email", ""),
+    return ContactInfo.model_construct(
+        id=str(author.get("id") or ""),
+        name=str(author.get("name") or ""),
+        email=str(author.get("email") or ""),
     )
 
 
@@ -64,14 +103,27 @@ async def intercom_webhook(request: Request):
     ):
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    payload = await request.json()
+    # Cheap byte scan so unrelated topics are acknowledged without parsing.
+    if not any(topic in raw_body for topic in _HANDLED_TOPIC_BYTES):
+        return {"status": "ok"}
+
+    # Parse the body already read for the signature check instead of
+    # having Starlette re-read and re-decode it.
+    payload = orjson.loads(raw_body)
     topic = payload.get("topic", "")
 
-    if topic in ("conversation.user.created", "conversation.user.replied"):
+    if topic in _HANDLED_TOPICS:
         conversation_id = payload["data"]["item"]["id"]
         message_body = _extract_latest_message(payload)
         contact_info = _extract_contact_info(payload)
 
+        if _is_duplicate_delivery(conversation_id, message_body):
+            logger.info(
+                "Ignoring duplicate Intercom delivery for conversation %s",
+                conversation_id,
+            )
+            return {"status": "duplicate"}
+
         logger.info(
             "Received %s for conversation %s: %s",
             topic,
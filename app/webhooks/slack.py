@@ -1,7 +1,8 @@
-import json
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable
 
+import orjson
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
 
@@ -25,16 +26,126 @@ def set_orchestrator(orch: "OrchestratorAgent") -> None:
     orchestrator = orch
 
 
+# Header of the review block that quotes the customer message (see
+# SlackAgent._build_review_blocks).
+_CUSTOMER_MESSAGE_HEADER = "*Customer Message:*"
+_CUSTOMER_MESSAGE_PREFIX = _CUSTOMER_MESSAGE_HEADER + "\n>"
+
+# Status line that replaces a review message once it has been handled.
+_APPROVED_STATUS = (
+    ":white_check_mark: *Response Sent*\nApproved by @{user}\nConversation: {conversation_id}"
+)
+_EDITED_STATUS = (
+    ":pencil: *Edited Response Sent*\nEdited by @{user}\nConversation: {conversation_id}"
+)
+_REJECTED_STATUS = ":x: *Response Rejected*\nRejected by @{user}\nConversation: {conversation_id}"
+_EDIT_SEND_FAILED_STATUS = (
+    ":warning: *Edited Response Not Sent*\nEdited by @{user}\nConversation: {conversation_id}"
+)
+
+# Slack's limit on a view's private_metadata.
+_PRIVATE_METADATA_MAX_CHARS = 3000
+# Edit modal metadata is packed as conversation_id, user_id, channel_id,
+# message_ts and optionally the customer message, joined by this separator.
+# The customer message goes last, so it may contain the separator itself.
+_METADATA_SEP = "\x1f"
+
+# Static parts of the edit modal, shared by every request.
+_EDIT_MODAL_TITLE = {"type": "plain_text", "text": "Edit Response"}
+_EDIT_MODAL_SUBMIT = {"type": "plain_text", "text": "Send"}
+_EDIT_MODAL_LABEL = {"type": "plain_text", "text": "Response"}
+
+
+def _status_blocks(template: str, user: str, conversation_id: str) -> list[dict]:
+    """Blocks for a handled review message."""
+    text = template.format(user=user, conversation_id=conversation_id)
+    return [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]
+
+
+async def _send_and_update(
+    client,
+    send: Awaitable[None] | None,
+    *,
+    channel: str,
+    ts: str,
+    blocks: list[dict],
+    text: str,
+    failure_blocks: list[dict],
+) -> None:
+    """Send the reply to Intercom while marking the review message handled.
+
+    Both calls run concurrently. If the send fails, the review message is
+    switched to ``failure_blocks`` (the original review blocks, when still
+    at hand, so the reviewer can try again) and the error is re-raised.
+    """
+    update = client.chat_update(channel=channel, ts=ts, blocks=blocks, text=text)
+    if send is None:
+        await update
+        return
+
+    sent, updated = await asyncio.gather(send, update, return_exceptions=True)
+    if isinstance(sent, BaseException):
+        if not isinstance(updated, BaseException) and failure_blocks:
+            await client.chat_update(
+                channel=channel, ts=ts, blocks=failure_blocks, text=text
+            )
+        raise sent
+    if isinstance(updated, BaseException):
+        raise updated
+
+
+def _pack_edit_metadata(
+    conversation_id: str,
+    user_id: str,
+    channel_id: str,
+    message_ts: str,
+    customer_message: str,
+) -> str:
+    """Build the edit modal's private_metadata.
+
+    The customer message is left out when it would push the metadata past
+    Slack's limit.
+    """
+    ids = _METADATA_SEP.join((conversation_id, user_id, channel_id, message_ts))
+    packed = f"{ids}{_METADATA_SEP}{customer_message}"
+    return packed if len(packed) <= _PRIVATE_METADATA_MAX_CHARS else ids
+
+
+def _unpack_edit_metadata(
+    private_metadata: str,
+) -> tuple[str, str, str, str, str | None]:
+    """Inverse of _pack_edit_metadata.
+
+    Returns (conversation_id, user_id, channel_id, message_ts,
+    customer_message); customer_message is None when it was not carried.
+    Modals opened before the packed format still hold a JSON object.
+    """
+    if _METADATA_SEP not in private_metadata:
+        legacy = orjson.loads(private_metadata)
+        return (
+            legacy["conversation_id"],
+            legacy.get("user_id", ""),
+            legacy["channel_id"],
+            legacy["message_ts"],
+            legacy.get("customer_message"),
+        )
+    conversation_id, user_id, channel_id, message_ts, *rest = (
+        private_metadata.split(_METADATA_SEP, 4)
+    )
+    return conversation_id, user_id, channel_id, message_ts, rest[0] if rest else None
+
+
 def _extract_customer_message_from_blocks(blocks: list[dict]) -> str:
     """Extract the customer message from the review message blocks."""
     for block in blocks:
-        text = block.get("text", {})
-        if isinstance(text, dict):
-            value = text.get("text", "")
-            if value.startswith("*Customer Message:*"):
-                # Remove the markdown prefix and quote marker
-                msg = value.replace("*Customer Message:*\n>", "")
-                return msg.strip()
+        text = block.get("text")
+        if not isinstance(text, dict):
+            continue
+        value = text.get("text", "")
+        if value.startswith(_CUSTOMER_MESSAGE_PREFIX):
+            return value[len(_CUSTOMER_MESSAGE_PREFIX):].strip()
+        if value.startswith(_CUSTOMER_MESSAGE_HEADER):
+            return value[len(_CUSTOMER_MESSAGE_HEADER):].strip()
     return ""
 
 
@@ -42,40 +153,31 @@ def _extract_customer_message_from_blocks(blocks: list[dict]) -> str:
 async def handle_approve(ack, action, client, body):
     """Approve and send the AI response to Intercom."""
     await ack()
-    payload = json.loads(action["value"])
+    payload = orjson.loads(action["value"])
     conversation_id = payload["conversation_id"]
     response_text = payload["response_text"]
     user_id = payload.get("user_id", "")
     reasoning = payload.get("reasoning", "")
 
-    customer_message = _extract_customer_message_from_blocks(
-        body["message"]["blocks"]
-    )
+    original_blocks = body["message"]["blocks"]
+    customer_message = _extract_customer_message_from_blocks(original_blocks)
 
+    send = None
     if orchestrator:
-        await orchestrator.send_approved_response(
+        send = orchestrator.send_approved_response(
             conversation_id, customer_message, response_text,
             user_id=user_id, reasoning=reasoning,
         )
 
     user = body["user"]["username"]
-    await client.chat_update(
+    await _send_and_update(
+        client,
+        send,
         channel=body["channel"]["id"],
         ts=body["message"]["ts"],
-        blocks=[
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f":white_check_mark: *Response Sent*\n"
-                        f"Approved by @{user}\n"
-                        f"Conversation: {conversation_id}"
-                    ),
-                },
-            }
-        ],
+        blocks=_status_blocks(_APPROVED_STATUS, user, conversation_id),
         text=f"Response approved for conversation {conversation_id}",
+        failure_blocks=original_blocks,
     )
     logger.info(
         "Response approved by %s for conversation %s", user, conversation_id
@@ -86,20 +188,30 @@ async def handle_approve(ack, action, client, body):
 async def handle_edit(ack, action, client, body):
     """Open a modal for editing the AI response before sending."""
     await ack()
-    payload = json.loads(action["value"])
+    payload = orjson.loads(action["value"])
+
+    # Carry the customer message into the modal so the submission doesn't
+    # need to fetch the review message again; drop it if it doesn't fit.
+    private_metadata = _pack_edit_metadata(
+        payload["conversation_id"],
+        payload.get("user_id", ""),
+        body["channel"]["id"],
+        body["message"]["ts"],
+        _extract_customer_message_from_blocks(body["message"]["blocks"]),
+    )
 
     await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
             "callback_id": "edit_response_modal",
-            "title": {"type": "plain_text", "text": "Edit Response"},
-            "submit": {"type": "plain_text", "text": "Send"},
+            "title": _EDIT_MODAL_TITLE,
+            "submit": _EDIT_MODAL_SUBMIT,
             "blocks": [
                 {
                     "type": "input",
                     "block_id": "response_block",
-                    "label": {"type": "plain_text", "text": "Response"},
+                    "label": _EDIT_MODAL_LABEL,
                     "element": {
                         "type": "plain_text_input",
                         "action_id": "response_text",
@@ -108,12 +220,7 @@ async def handle_edit(ack, action, client, body):
                     },
                 },
             ],
-            "private_metadata": json.dumps({
-                "conversation_id": payload["conversation_id"],
-                "user_id": payload.get("user_id", ""),
-                "channel_id": body["channel"]["id"],
-                "message_ts": body["message"]["ts"],
-            }),
+            "private_metadata": private_metadata,
         },
     )
 
@@ -125,47 +232,41 @@ async def handle_edit_submission(ack, view, client, body):
     edited_text = (
         view["state"]["values"]["response_block"]["response_text"]["value"]
     )
-    metadata = json.loads(view["private_metadata"])
-    conversation_id = metadata["conversation_id"]
-    user_id = metadata.get("user_id", "")
-
-    # Fetch original message to extract customer question
-    original_msg = await client.conversations_history(
-        channel=metadata["channel_id"],
-        latest=metadata["message_ts"],
-        inclusive=True,
-        limit=1,
+    conversation_id, user_id, channel_id, message_ts, customer_message = (
+        _unpack_edit_metadata(view["private_metadata"])
     )
-    customer_message = ""
-    if original_msg["messages"]:
-        customer_message = _extract_customer_message_from_blocks(
-            original_msg["messages"][0].get("blocks", [])
+
+    user = body["user"]["username"]
+
+    if customer_message is None:
+        # Too long for the modal metadata: fetch the original message.
+        original_msg = await client.conversations_history(
+            channel=channel_id,
+            latest=message_ts,
+            inclusive=True,
+            limit=1,
         )
+        customer_message = ""
+        if original_msg["messages"]:
+            customer_message = _extract_customer_message_from_blocks(
+                original_msg["messages"][0].get("blocks", [])
+            )
 
+    send = None
     if orchestrator:
-        await orchestrator.send_approved_response(
+        send = orchestrator.send_approved_response(
             conversation_id, customer_message, edited_text,
             user_id=user_id, edited=True,
         )
 
-    user = body["user"]["username"]
-    await client.chat_update(
-        channel=metadata["channel_id"],
-        ts=metadata["message_ts"],
-        blocks=[
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f":pencil: *Edited Response Sent*\n"
-                        f"Edited by @{user}\n"
-                        f"Conversation: {conversation_id}"
-                    ),
-                },
-            }
-        ],
+    await _send_and_update(
+        client,
+        send,
+        channel=channel_id,
+        ts=message_ts,
+        blocks=_status_blocks(_EDITED_STATUS, user, conversation_id),
         text=f"Edited response sent for conversation {conversation_id}",
+        failure_blocks=_status_blocks(_EDIT_SEND_FAILED_STATUS, user, conversation_id),
     )
     logger.info(
         "Edited response sent by %s for conversation %s",
@@ -178,26 +279,14 @@ async def handle_edit_submission(ack, view, client, body):
 async def handle_reject(ack, action, client, body):
     """Reject the AI response — no reply sent to Intercom."""
     await ack()
-    payload = json.loads(action["value"])
+    payload = orjson.loads(action["value"])
     conversation_id = payload["conversation_id"]
 
     user = body["user"]["username"]
     await client.chat_update(
         channel=body["channel"]["id"],
         ts=body["message"]["ts"],
-        blocks=[
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f":x: *Response Rejected*\n"
-                        f"Rejected by @{user}\n"
-                        f"Conversation: {conversation_id}"
-                    ),
-                },
-            }
-        ],
+        blocks=_status_blocks(_REJECTED_STATUS, user, conversation_id),
         text=f"Response rejected for conversation {conversation_id}",
     )
     logger.info(
@@ -7,11 +7,14 @@ external docs, and when it has enough information to synthesize an answer.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+from typing import TYPE_CHECKING, Awaitable, Iterable, TypeVar
 
 from openai import AsyncOpenAI
+from pydantic import BaseModel
 
+from app.utils.ttl_cache import TTLCache
 from skill_consumer.config import SkillAgentConfig
 from skill_consumer.prompts import (
     KEYWORD_EXTRACTION_PROMPT,
@@ -29,8 +32,42 @@ from skill_consumer.schemas import (
 )
 from skill_consumer.tools import fetch_url, read_file, run_script
 
+if TYPE_CHECKING:
+    import httpx
+    from openai.types.chat import ParsedChatCompletion
+
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_T = TypeVar("_T")
+
+# Fraction of max_context_chars past which another OBSERVE is not worth it.
+_CONTEXT_NEAR_FULL = 0.9
+
+# Top BM25 hits read ahead while PLAN is running.
+_PREFETCH_FILES = 3
+
+# One prompt-cache bucket per step, so each step's static system prompt is
+# served from OpenAI's prefix cache. The user messages keep their growing
+# parts (accumulated sources) ahead of the per-iteration ones, so OBSERVE
+# calls for one question also share most of their prefix.
+_PROMPT_CACHE_KEYS = {
+    "keywords": "skill-keywords-v1",
+    "plan": "skill-plan-v1",
+    "observe": "skill-observe-v1",
+    "synthesize": "skill-synthesize-v1",
+}
+
+
+def _cancel_all(tasks: dict[str, asyncio.Task]) -> None:
+    for task in tasks.values():
+        task.cancel()
+
+
+async def _bounded(sem: asyncio.Semaphore, aw: Awaitable[_T]) -> _T:
+    async with sem:
+        return await aw
+
 
 class SkillAgent:
     """LLM-driven agent that navigates skill files to answer questions."""
@@ -39,60 +76,209 @@ class SkillAgent:
         self,
         openai_api_key: str,
         config: SkillAgentConfig | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.config = config or SkillAgentConfig()
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        # A shared pooled client keeps OpenAI connections warm across calls;
+        # without one the SDK creates its own.
+        self.client = AsyncOpenAI(api_key=openai_api_key, http_client=http_client)
         self._retriever: SkillRetriever | None = None
+        self._index_lock = asyncio.Lock()
+        # relative_path -> base_path for every indexed document; built with
+        # the index, which never changes afterwards.
+        self._base_paths: dict[str, str] = {}
+        # Normalized question -> answer.
+        self._answer_cache: TTLCache[str, SkillAgentResponse] = TTLCache(
+            self.config.answer_cache_ttl, self.config.answer_cache_max_entries
+        )
+        # question key -> [running answer task, number of callers awaiting it]
+        self._inflight: dict[str, list] = {}
+        # Speculative plans reused / finished, logged to show the hit rate.
+        self._spec_plan_reused = 0
+        self._spec_plan_finished = 0
 
     @property
     def retriever(self) -> SkillRetriever:
         """Lazily build and cache the BM25 index."""
         if self._retriever is None:
-            self._retriever = SkillRetriever(self.config.skills_dir)
-            self._retriever.build_index()
-            logger.info("BM25 retriever initialized")
+            self._set_retriever(self._build_retriever())
         return self._retriever
 
+    async def initialize(self) -> None:
+        """Build the BM25 index in a worker thread so the event loop stays free.
+
+        Reading every skill file is blocking I/O; call this at startup.
+        answer() also awaits it, so a cold agent never builds on the loop.
+        """
+        if self._retriever is not None:
+            return
+        async with self._index_lock:
+            if self._retriever is None:
+                self._set_retriever(await asyncio.to_thread(self._build_retriever))
+
+    def _build_retriever(self) -> SkillRetriever:
+        retriever = SkillRetriever(self.config.skills_dir)
+        retriever.build_index()
+        return retriever
+
+    def _set_retriever(self, retriever: SkillRetriever) -> None:
+        for doc in retriever._documents:
+            self._base_paths.setdefault(doc.relative_path, doc.base_path)
+        self._retriever = retriever
+        logger.info("BM25 retriever initialized")
+
     async def answer(self, question: str) -> SkillAgentResponse:
         """Answer a question by navigating skill documentation.
 
         This is the main entry point. It runs:
         EXTRACT KEYWORDS → BM25 SEARCH → PLAN → ACT → OBSERVE → (repeat or SYNTHESIZE)
+
+        Answers are cached per normalized question, and concurrent calls for
+        the same question share one run.
         """
-        accumulated_content: list[dict[str, str]] = []  # [{source, content}]
+        key = " ".join(question.lower().split())
+        if self.config.answer_cache_ttl <= 0 or len(key) < self.config.answer_cache_min_chars:
+            return await self._answer_uncached(question)
+
+        cached = self._answer_cache.get(key)
+        if cached is not None:
+            logger.info("Skill agent answer cache hit")
+            return cached
+
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._answer_uncached(question))
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+            entry = self._inflight[key] = [task, 0]
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Only stop the shared run when nobody else is waiting on it.
+            if entry[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+
+    def _finish_inflight(self, key: str, task: asyncio.Future) -> None:
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        # Empty answers come from failed steps; let the next ask retry.
+        if response.answer_text:
+            self._answer_cache.put(key, response)
+
+    async def _answer_uncached(self, question: str) -> SkillAgentResponse:
+        # Each source is formatted for the prompt once, when it is added.
+        accumulated_content: list[str] = []
         files_read: set[str] = set()
+        urls_fetched: set[str] = set()
         total_chars = 0
+        # Number of sources the last OBSERVE call saw.
+        observed_count: int | None = None
+
+        await self.initialize()
+
+        # Speculative PLAN over BM25 hits for the raw question, running
+        # alongside keyword extraction.
+        spec_task: asyncio.Task[PlanDecision] | None = None
+        spec_bases: dict[str, str] = {}
+        if self.config.speculative_plan:
+            spec_files = self.retriever.search([question], top_k=self.config.bm25_top_k)
+            if spec_files:
+                spec_bases = {f.relative_path: f.base_path for f in spec_files}
+                spec_task = asyncio.create_task(
+                    self._plan(question, self._retrieved_file_lines(spec_files))
+                )
 
-        # --- Step 0: EXTRACT KEYWORDS ---
-        try:
-            keywords = await self._extract_keywords(question)
-            logger.info("Extracted keywords: %s", keywords)
-        except Exception:
-            logger.exception("Skill agent keyword extraction failed")
-            return self._empty_response("Keyword extraction step failed")
-
-        # --- Step 1: BM25 SEARCH ---
-        retrieved_files = self.retriever.search(
-            keywords, top_k=self.config.bm25_top_k
-        )
-        logger.info("BM25 retrieved %d files", len(retrieved_files))
-
-        if not retrieved_files:
-            return self._empty_response("No relevant files found for the query.")
-
-        # Build path → base_path lookup from BM25 results
-        path_to_base: dict[str, str] = {
-            f.relative_path: f.base_path for f in retrieved_files
-        }
-
-        # --- Step 2: PLAN ---
+        plan: PlanDecision | None = None
+        # Top BM25 hits read while PLAN runs; the first ACT step uses them.
+        prefetched: dict[str, asyncio.Task[dict]] = {}
         try:
-            plan = await self._plan(question, retrieved_files)
-        except Exception:
-            logger.exception("Skill agent PLAN step failed")
-            return self._empty_response("Plan step failed")
+            # --- Step 0: EXTRACT KEYWORDS ---
+            try:
+                keywords = await self._extract_keywords(question)
+                logger.info("Extracted keywords: %s", keywords)
+            except Exception:
+                logger.exception("Skill agent keyword extraction failed")
+                return self._empty_response("Keyword extraction step failed")
+
+            # --- Step 1: BM25 SEARCH ---
+            retrieved_files = self.retriever.search(
+                keywords, top_k=self.config.bm25_top_k
+            )
+            logger.info("BM25 retrieved %d files", len(retrieved_files))
+
+            if not retrieved_files:
+                return self._empty_response("No relevant files found for the query.")
+
+            # Build path → base_path lookup from BM25 results
+            path_to_base: dict[str, str] = {
+                f.relative_path: f.base_path for f in retrieved_files
+            }
+            # Formatted once; OBSERVE only filters out files already read.
+            file_lines = self._retrieved_file_lines(retrieved_files)
+
+            # The planner usually picks the top hits; reading them takes
+            # milliseconds against seconds of LLM latency.
+            prefetched = {
+                f.relative_path: asyncio.create_task(
+                    read_file(
+                        f.base_path, f.relative_path,
+                        max_chars=self.config.max_context_chars,
+                    )
+                )
+                for f in retrieved_files[:_PREFETCH_FILES]
+            }
+
+            # --- Step 2: PLAN ---
+            # The speculative plan stands if every file it picked was found
+            # by either search; an empty pick is re-planned over the keyword
+            # hits.
+            if spec_task is not None:
+                try:
+                    spec_plan = await spec_task
+                except Exception:
+                    logger.warning("Speculative PLAN step failed, planning again")
+                else:
+                    self._spec_plan_finished += 1
+                    if spec_plan.files_to_read and all(
+                        f.path in path_to_base or f.path in spec_bases
+                        for f in spec_plan.files_to_read
+                    ):
+                        plan = spec_plan
+                        self._spec_plan_reused += 1
+                        for path, base_path in spec_bases.items():
+                            path_to_base.setdefault(path, base_path)
+                    logger.info(
+                        "Speculative plan %s (%d/%d reused)",
+                        "reused" if plan is not None else "discarded",
+                        self._spec_plan_reused,
+                        self._spec_plan_finished,
+                    )
+            if plan is None:
+                try:
+                    plan = await self._plan(question, file_lines)
+                except Exception:
+                    logger.exception("Skill agent PLAN step failed")
+                    return self._empty_response("Plan step failed")
+        finally:
+            if spec_task is not None:
+                if not spec_task.done():
+                    spec_task.cancel()
+                elif not spec_task.cancelled():
+                    spec_task.exception()  # mark a failure as retrieved
+            if plan is None:
+                _cancel_all(prefetched)
 
         if not plan.files_to_read and not plan.needs_external_search:
+            _cancel_all(prefetched)
             return self._empty_response(
                 "Question does not relate to any available skill documentation."
             )
@@ -105,11 +291,13 @@ class SkillAgent:
                 self.config.max_iterations,
             )
 
-            # ACT: read files from plan
+            # ACT: read files from plan concurrently, at most
+            # max_files_per_iteration in flight at once
+            to_read: dict[str, str] = {}  # path -> base_path, plan order
             for file_req in plan.files_to_read:
-                if file_req.path in files_read:
+                if file_req.path in files_read or file_req.path in to_read:
                     continue
-                if len(files_read) >= self.config.max_total_files:
+                if len(files_read) + len(to_read) >= self.config.max_total_files:
                     logger.warning("Max total files reached (%d)", self.config.max_total_files)
                     break
 
@@ -120,28 +308,55 @@ class SkillAgent:
                 if base_path is None:
                     logger.warning("Could not resolve base path for: %s", file_req.path)
                     continue
-
-                result = await read_file(base_path, file_req.path)
+                to_read[file_req.path] = base_path
+
+            # Don't pull more of a file off disk than the context can hold.
+            remaining_chars = self.config.max_context_chars - total_chars
+            read_sem = asyncio.Semaphore(self.config.max_files_per_iteration)
+            results = await asyncio.gather(
+                *(
+                    prefetched.pop(path)
+                    if path in prefetched
+                    else _bounded(read_sem, read_file(base_path, path, max_chars=remaining_chars))
+                    for path, base_path in to_read.items()
+                )
+            )
+            _cancel_all(prefetched)  # unused prefetches (first iteration only)
+            prefetched.clear()
+            # Each read was capped at the budget left before the batch, so
+            # keep sources in plan (priority) order until the budget is spent.
+            # The budget is counted in characters, not tokens: tiktoken is not
+            # a dependency, fetches its encodings at runtime and has no
+            # mapping for the configured gpt-5 models, and chars track tokens
+            # closely enough for a cut-off.
+            for path, result in zip(to_read, results):
                 if result.get("content"):
-                    accumulated_content.append({
-                        "source": file_req.path,
-                        "content": result["content"],
-                    })
+                    if total_chars >= self.config.max_context_chars:
+                        logger.info("Context budget reached, dropping %s", path)
+                        continue
+                    accumulated_content.append(self._format_source(path, result["content"]))
                     total_chars += len(result["content"])
-                    files_read.add(file_req.path)
+                    files_read.add(path)
                 elif result.get("error"):
-                    logger.warning("Error reading %s: %s", file_req.path, result["error"])
+                    logger.warning("Error reading %s: %s", path, result["error"])
 
             # ACT: fetch external URLs if requested
             if plan.needs_external_search and self.config.enable_url_fetch:
-                for url in plan.external_urls[:3]:
-                    result = await fetch_url(url, self.config.allowed_fetch_domains)
+                urls = [
+                    url
+                    for url in dict.fromkeys(plan.external_urls)
+                    if url not in urls_fetched
+                ][:3]
+                results = await asyncio.gather(
+                    *(fetch_url(url, self.config.allowed_fetch_domains) for url in urls)
+                )
+                for url, result in zip(urls, results):
                     if result.get("content"):
-                        accumulated_content.append({
-                            "source": url,
-                            "content": result["content"],
-                        })
+                        accumulated_content.append(
+                            self._format_source(url, result["content"])
+                        )
                         total_chars += len(result["content"])
+                        urls_fetched.add(url)
 
             # Check context budget
             if total_chars >= self.config.max_context_chars:
@@ -151,11 +366,31 @@ class SkillAgent:
                 )
                 break
 
-            # OBSERVE: decide next action (skip on last iteration)
+            # OBSERVE: decide next action (skip on last iteration).
+            # Each call is per question on purpose: OBSERVE requests from
+            # concurrent answer() calls are not batched into one prompt (too
+            # few to fill a batch, and mixing conversations' documents risks
+            # cross-talk); redundant calls within a question are skipped.
             if iteration < self.config.max_iterations - 1:
+                # Nothing new since the last observation (requested files
+                # were already read or unresolvable): asking again would
+                # cost a round-trip for the same decision.
+                if observed_count == len(accumulated_content):
+                    logger.info("No new content since last observe, synthesizing now")
+                    break
+                # Nearly out of context, or out of files with no other way
+                # to gather evidence: any decision ends in synthesis.
+                if total_chars >= self.config.max_context_chars * _CONTEXT_NEAR_FULL or (
+                    len(files_read) >= self.config.max_total_files
+                    and not self.config.enable_url_fetch
+                    and not self.config.enable_script_execution
+                ):
+                    logger.info("Read budget nearly spent, synthesizing now")
+                    break
+                observed_count = len(accumulated_content)
                 try:
                     observe = await self._observe(
-                        question, accumulated_content, files_read, retrieved_files
+                        question, accumulated_content, files_read, file_lines
                     )
                 except Exception:
                     logger.exception("Skill agent OBSERVE step failed")
@@ -203,10 +438,12 @@ class SkillAgent:
                             )
                             output = result.get("stdout") or result.get("error", "")
                             if output:
-                                accumulated_content.append({
-                                    "source": f"script:{observe.script_to_run.script_path}",
-                                    "content": output,
-                                })
+                                accumulated_content.append(
+                                    self._format_source(
+                                        f"script:{observe.script_to_run.script_path}",
+                                        output,
+                                    )
+                                )
                                 total_chars += len(output)
                     # After script, continue loop (will observe again)
                     plan = PlanDecision(
@@ -228,60 +465,57 @@ class SkillAgent:
 
     async def _extract_keywords(self, question: str) -> list[str]:
         """Use a lightweight LLM call to extract search keywords from the question."""
-        response = await self.client.chat.completions.create(
+        response = await self.client.chat.completions.parse(
             model=self.config.keyword_model,
             messages=[
                 {"role": "system", "content": KEYWORD_EXTRACTION_PROMPT},
                 {"role": "user", "content": question},
             ],
-            response_format={"type": "json_object"},
+            response_format=KeywordExtraction,
             timeout=self.config.llm_timeout,
+            extra_body={"prompt_cache_key": _PROMPT_CACHE_KEYS["keywords"]},
         )
 
-        raw_text = response.choices[0].message.content
-        logger.debug("[Skill Agent - Keywords] LLM response: %s", raw_text)
-        raw = json.loads(raw_text)
-        extraction = KeywordExtraction(**raw)
+        extraction = self._parsed(response, "Keywords")
         return extraction.keywords
 
     async def _plan(
-        self, question: str, retrieved_files: list[RetrievedFile]
+        self, question: str, file_lines: list[tuple[str, str]]
     ) -> PlanDecision:
         """Use the router model to decide which of the BM25-retrieved files to read."""
-        files_text = self._format_retrieved_files(retrieved_files)
+        files_text = self._join_file_lines(line for _, line in file_lines)
         user_msg = (
             f"## Relevant Documentation Files\n\n{files_text}\n\n"
             f"## User Question\n\n{question}"
         )
 
-        response = await self.client.chat.completions.create(
+        response = await self.client.chat.completions.parse(
             model=self.config.router_model,
             messages=[
                 {"role": "system", "content": ROUTER_SYSTEM_PROMPT},
                 {"role": "user", "content": user_msg},
             ],
-            response_format={"type": "json_object"},
+            response_format=PlanDecision,
             timeout=self.config.llm_timeout,
+            extra_body={"prompt_cache_key": _PROMPT_CACHE_KEYS["plan"]},
         )
 
-        raw_text = response.choices[0].message.content
-        logger.debug("[Skill Agent - Plan] LLM response: %s", raw_text)
-        raw = json.loads(raw_text)
-        return PlanDecision(**raw)
+        return self._parsed(response, "Plan")
 
     async def _observe(
         self,
         question: str,
-        accumulated_content: list[dict[str, str]],
+        accumulated_content: list[str],
         files_read: set[str],
-        retrieved_files: list[RetrievedFile],
+        file_lines: list[tuple[str, str]],
     ) -> ObserveDecision:
         """Evaluate retrieved content and decide the next action."""
         content_block = self._format_content(accumulated_content)
 
         # Show only unread files from BM25 results
-        unread_files = [f for f in retrieved_files if f.relative_path not in files_read]
-        files_text = self._format_retrieved_files(unread_files)
+        files_text = self._join_file_lines(
+            line for path, line in file_lines if path not in files_read
+        )
 
         user_msg = (
             f"## User Question\n\n{question}\n\n"
@@ -290,25 +524,23 @@ class SkillAgent:
             f"## Available Files (not yet read)\n\n{files_text}"
         )
 
-        response = await self.client.chat.completions.create(
+        response = await self.client.chat.completions.parse(
             model=self.config.synthesis_model,
             messages=[
                 {"role": "system", "content": OBSERVE_SYSTEM_PROMPT},
                 {"role": "user", "content": user_msg},
             ],
-            response_format={"type": "json_object"},
+            response_format=ObserveDecision,
             timeout=self.config.llm_timeout,
+            extra_body={"prompt_cache_key": _PROMPT_CACHE_KEYS["observe"]},
         )
 
-        raw_text = response.choices[0].message.content
-        logger.debug("[Skill Agent - Observe] LLM response: %s", raw_text)
-        raw = json.loads(raw_text)
-        return ObserveDecision(**raw)
+        return self._parsed(response, "Observe")
 
     async def _synthesize(
         self,
         question: str,
-        accumulated_content: list[dict[str, str]],
+        accumulated_content: list[str],
     ) -> SkillAgentResponse:
         """Produce a final answer from accumulated documentation content."""
         content_block = self._format_content(accumulated_content)
@@ -318,48 +550,61 @@ class SkillAgent:
             f"## Retrieved Documentation\n\n{content_block}"
         )
 
-        response = await self.client.chat.completions.create(
+        response = await self.client.chat.completions.parse(
             model=self.config.synthesis_model,
             messages=[
                 {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
                 {"role": "user", "content": user_msg},
             ],
-            response_format={"type": "json_object"},
+            response_format=SkillAgentResponse,
             timeout=self.config.llm_timeout,
+            extra_body={"prompt_cache_key": _PROMPT_CACHE_KEYS["synthesize"]},
         )
 
-        raw_text = response.choices[0].message.content
-        logger.debug("[Skill Agent - Synthesize] LLM response: %s", raw_text)
-        raw = json.loads(raw_text)
-        return SkillAgentResponse(**raw)
+        return self._parsed(response, "Synthesize")
+
+    @staticmethod
+    def _parsed(response: ParsedChatCompletion[_ModelT], step: str) -> _ModelT:
+        """Return the schema-validated output of a structured-output call."""
+        message = response.choices[0].message
+        logger.debug("[Skill Agent - %s] LLM response: %s", step, message.content)
+        if message.parsed is None:
+            raise ValueError(f"{step} step returned no parsed output: {message.refusal}")
+        return message.parsed
 
     def _resolve_base_path_fallback(self, relative_path: str) -> str | None:
-        """Fallback: search indexed documents for a file not in BM25 results."""
-        for doc in self.retriever._documents:
-            if doc.relative_path == relative_path:
-                return doc.base_path
-        return None
+        """Fallback: look up an indexed file that was not in the BM25 results.
+
+        Only called after initialize(), which builds the path lookup.
+        """
+        return self._base_paths.get(relative_path)
 
     @staticmethod
-    def _format_retrieved_files(files: list[RetrievedFile]) -> str:
-        """Format BM25 results as a concise list for LLM prompts."""
-        if not files:
-            return "(No relevant files found)"
-        lines = []
-        for f in files:
-            lines.append(
+    def _retrieved_file_lines(files: list[RetrievedFile]) -> list[tuple[str, str]]:
+        """Format each BM25 result once as a (relative_path, prompt line) pair."""
+        return [
+            (
+                f.relative_path,
                 f"- [{f.file_type}] {f.relative_path} "
-                f"(relevance: {f.bm25_score:.2f}) -- {f.description}"
+                f"(relevance: {f.bm25_score:.2f}) -- {f.description}",
             )
-        return "\n".join(lines)
+            for f in files
+        ]
+
+    @staticmethod
+    def _join_file_lines(lines: Iterable[str]) -> str:
+        """Join formatted BM25 result lines into a list for LLM prompts."""
+        return "\n".join(lines) or "(No relevant files found)"
+
+    @staticmethod
+    def _format_source(source: str, content: str) -> str:
+        """Format one retrieved source for inclusion in an LLM prompt."""
+        return f"### Source: {source}\n\n{content}"
 
     @staticmethod
-    def _format_content(accumulated: list[dict[str, str]]) -> str:
-        """Format accumulated content for inclusion in an LLM prompt."""
-        parts = []
-        for item in accumulated:
-            parts.append(f"### Source: {item['source']}\n\n{item['content']}")
-        return "\n\n---\n\n".join(parts)
+    def _format_content(accumulated: list[str]) -> str:
+        """Join the already-formatted sources into one prompt block."""
+        return "\n\n---\n\n".join(accumulated)
 
     @staticmethod
     def _empty_response(reason: str) -> SkillAgentResponse:
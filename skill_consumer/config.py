@@ -15,13 +15,22 @@ class SkillAgentConfig:
     max_iterations: int = 4  # max think-act-observe cycles
     max_files_per_iteration: int = 5
     max_total_files: int = 8
+    # Plan over BM25 hits for the raw question while keywords are being
+    # extracted; the plan is reused when every file it picked was also found
+    # by the keyword search or the raw-question search.
+    speculative_plan: bool = True
 
     # BM25 retrieval
     bm25_top_k: int = 10  # number of files returned by BM25 search
     keyword_model: str = "gpt-5-mini"  # lightweight model for keyword extraction
 
     # Content limits
-    max_context_chars: int = 50_000
+    max_context_chars: int = 50_000  # characters, used as a proxy for tokens
+
+    # Answer cache (repeat questions skip the whole loop)
+    answer_cache_ttl: float = 3600.0  # seconds; 0 disables the cache
+    answer_cache_max_entries: int = 1024
+    answer_cache_min_chars: int = 12  # shorter questions are too ambiguous to reuse
 
     # Paths
     skills_dir: str = "skills"
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
+from typing import Iterator
 
 import yaml
 
@@ -79,18 +80,15 @@ def build_manifest(skills_dir: str) -> dict[str, SkillManifest]:
         )
 
         # Walk all files in the skill directory
-        for root, _dirs, filenames in os.walk(skill_path):
-            for fname in sorted(filenames):
-                full_path = os.path.join(root, fname)
-                rel_path = os.path.relpath(full_path, skill_path)
-                manifest.files.append(
-                    SkillFile(
-                        relative_path=rel_path,
-                        description=_derive_description(rel_path, fname),
-                        file_type=_classify_file(rel_path),
-                        size_bytes=os.path.getsize(full_path),
-                    )
+        for rel_path, fname, size in _scan_files(skill_path, ""):
+            manifest.files.append(
+                SkillFile(
+                    relative_path=rel_path,
+                    description=_derive_description(rel_path, fname),
+                    file_type=_classify_file(rel_path),
+                    size_bytes=size,
                 )
+            )
 
         manifests[entry] = manifest
         logger.info(
@@ -100,6 +98,27 @@ def build_manifest(skills_dir: str) -> dict[str, SkillManifest]:
     return manifests
 
 
+def _scan_files(directory: str, rel_dir: str) -> Iterator[tuple[str, str, int]]:
+    """Yield (relative_path, file name, size) for every file under *directory*.
+
+    Files come before subdirectories, each in sorted order. Sizes come from
+    the cached ``os.scandir`` entries, so no separate getsize call is made.
+    Symlinked directories are listed but not descended into, as with os.walk.
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    subdirs = []
+    for entry in entries:
+        rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirs.append((entry.path, rel_path))
+            continue
+        yield rel_path, entry.name, entry.stat().st_size
+    for path, rel_path in subdirs:
+        yield from _scan_files(path, rel_path)
+
+
 def _parse_frontmatter(skill_md_path: str) -> tuple[str, str]:
     """Extract name and description from YAML frontmatter."""
     with open(skill_md_path, encoding="utf-8") as f:
@@ -31,11 +31,17 @@ ALLOWED_SCRIPTS = {
 }
 
 
-async def read_file(base_path: str, relative_path: str) -> dict:
+async def read_file(
+    base_path: str, relative_path: str, max_chars: int | None = None
+) -> dict:
     """Read a file from the skill directory.
 
+    At most ``max_chars`` characters (capped at MAX_FILE_CHARS) are read
+    from disk; longer files are truncated.
+
     Returns dict with 'content' on success or 'error' on failure.
     """
+    limit = MAX_FILE_CHARS if max_chars is None else min(max_chars, MAX_FILE_CHARS)
     full_path = os.path.normpath(os.path.join(base_path, relative_path))
 
     # Prevent path traversal
@@ -46,13 +52,13 @@ async def read_file(base_path: str, relative_path: str) -> dict:
         return {"error": f"File not found: {relative_path}", "content": ""}
 
     try:
-        with open(full_path, encoding="utf-8") as f:
-            content = f.read()
+        # One extra char tells us whether the file was cut short.
+        content = await asyncio.to_thread(_read_text, full_path, limit + 1)
 
-        if len(content) > MAX_FILE_CHARS:
+        if len(content) > limit:
             content = (
-                content[:MAX_FILE_CHARS]
-                + f"\n\n[TRUNCATED — file is {len(content)} chars, showing first {MAX_FILE_CHARS}]"
+                content[:limit]
+                + f"\n\n[TRUNCATED — file is longer than {limit} chars, showing first {limit}]"
             )
 
         return {
@@ -65,6 +71,11 @@ async def read_file(base_path: str, relative_path: str) -> dict:
         return {"error": str(e), "content": ""}
 
 
+def _read_text(path: str, max_chars: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read(max_chars)
+
+
 async def fetch_url(url: str, allowed_domains: list[str] | None = None) -> dict:
     """Fetch content from an external URL.
 
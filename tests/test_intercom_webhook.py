@@ -0,0 +1,99 @@
+"""Tests for the Intercom webhook's topic prefilter and delivery dedupe."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from app.webhooks import intercom
+
+
+def _payload(
+    topic: str = "conversation.user.created",
+    conversation_id: str = "conv-1",
+    delivery_attempts: int = 1,
+) -> bytes:
+    return orjson.dumps({
+        "topic": topic,
+        "delivery_attempts": delivery_attempts,
+        "data": {"item": {
+            "id": conversation_id,
+            "source": {"body": "<p>How do I reset my key?</p>", "author": {}},
+        }},
+    })
+
+
+def _request(body: bytes) -> SimpleNamespace:
+    return SimpleNamespace(
+        body=AsyncMock(return_value=body),
+        headers={"X-Hub-Signature": "sha1=test"},
+    )
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    monkeypatch.setattr(intercom, "_recent_deliveries", intercom.OrderedDict())
+    coordinator = SimpleNamespace(enqueue=AsyncMock())
+    monkeypatch.setattr(intercom, "message_coordinator", coordinator)
+    with patch.object(intercom, "verify_intercom_signature", return_value=True):
+        yield coordinator
+
+
+@pytest.mark.asyncio
+async def test_duplicate_delivery_is_enqueued_once(coordinator):
+    body = _payload()
+
+    first = await intercom.intercom_webhook(_request(body))
+    second = await intercom.intercom_webhook(_request(body))
+
+    assert first == {"status": "ok"}
+    assert second == {"status": "duplicate"}
+    coordinator.enqueue.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_retry_with_new_delivery_fields_is_duplicate(coordinator):
+    first = await intercom.intercom_webhook(_request(_payload(delivery_attempts=1)))
+    retry = await intercom.intercom_webhook(_request(_payload(delivery_attempts=2)))
+
+    assert first == {"status": "ok"}
+    assert retry == {"status": "duplicate"}
+    coordinator.enqueue.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_same_message_in_other_conversation_is_not_duplicate(coordinator):
+    await intercom.intercom_webhook(_request(_payload(conversation_id="conv-1")))
+    await intercom.intercom_webhook(_request(_payload(conversation_id="conv-2")))
+
+    assert coordinator.enqueue.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delivery_is_processed_again_after_ttl(coordinator):
+    body = _payload()
+    with patch.object(intercom.time, "monotonic", return_value=1000.0):
+        await intercom.intercom_webhook(_request(body))
+    later = 1000.0 + intercom._DELIVERY_TTL_SECONDS + 1
+    with patch.object(intercom.time, "monotonic", return_value=later):
+        result = await intercom.intercom_webhook(_request(body))
+
+    assert result == {"status": "ok"}
+    assert coordinator.enqueue.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unhandled_topic_skipped_before_parsing(coordinator):
+    body = _payload(topic="contact.created")
+
+    with patch.object(intercom.orjson, "loads") as loads:
+        first = await intercom.intercom_webhook(_request(body))
+        second = await intercom.intercom_webhook(_request(body))
+
+    assert first == second == {"status": "ok"}
+    loads.assert_not_called()
+    coordinator.enqueue.assert_not_awaited()
+    assert len(intercom._recent_deliveries) == 0
@@ -191,3 +191,78 @@ async def test_message_order_preserved(mock_orchestrator, contact):
     second_pos = body.index("Second")
     third_pos = body.index("Third")
     assert first_pos < second_pos < third_pos
+
+
+# ------------------------------------------------------------------
+# Redelivered duplicates and blank messages are dropped
+# ------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_duplicate_and_blank_messages_dropped(mock_orchestrator, contact):
+    coord = MessageCoordinator(mock_orchestrator, timeout=0.1)
+
+    await coord.enqueue("conv1", "Hello", contact, "alice@example.com")
+    await coord.enqueue("conv1", "  ", contact, "alice@example.com")
+    await coord.enqueue("conv1", "Hello ", contact, "alice@example.com")
+    await coord.enqueue("conv1", "Anyone there", contact, "alice@example.com")
+    await asyncio.sleep(0.25)
+
+    body = mock_orchestrator.handle_incoming_message.call_args.kwargs["message_body"]
+    assert body == "Hello\n\nAnyone there"
+
+
+# ------------------------------------------------------------------
+# Early flush: complete single message / oversized buffer
+# ------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_complete_sentence_uses_quick_timeout(mock_orchestrator, contact):
+    coord = MessageCoordinator(mock_orchestrator, timeout=1.0, quick_timeout=0.05)
+
+    await coord.enqueue("conv1", "How do I reset my password?", contact, "alice@example.com")
+    await asyncio.sleep(0.2)
+
+    mock_orchestrator.handle_incoming_message.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_large_buffer_flushes_immediately(mock_orchestrator, contact):
+    coord = MessageCoordinator(mock_orchestrator, timeout=1.0, max_buffered_chars=20)
+
+    await coord.enqueue("conv1", "part one of a message", contact, "alice@example.com")
+    await asyncio.sleep(0.05)
+
+    mock_orchestrator.handle_incoming_message.assert_called_once()
+
+
+# ------------------------------------------------------------------
+# Buffer limit: the oldest conversation is flushed, not dropped
+# ------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_oldest_buffer_flushed_when_limit_reached(mock_orchestrator, contact):
+    coord = MessageCoordinator(mock_orchestrator, timeout=1.0, max_conversations=2)
+
+    await coord.enqueue("conv1", "first", contact, "alice@example.com")
+    await coord.enqueue("conv2", "second", contact, "alice@example.com")
+    await coord.enqueue("conv3", "third", contact, "alice@example.com")
+    await asyncio.sleep(0.05)
+
+    mock_orchestrator.handle_incoming_message.assert_called_once()
+    assert mock_orchestrator.handle_incoming_message.call_args.kwargs["conversation_id"] == "conv1"
+    assert set(coord._buffers) == {"conv2", "conv3"}
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_error_does_not_leak_buffer(mock_orchestrator, contact):
+    mock_orchestrator.handle_incoming_message.side_effect = RuntimeError("boom")
+    coord = MessageCoordinator(mock_orchestrator, timeout=0.05)
+
+    await coord.enqueue("conv1", "Hello", contact, "alice@example.com")
+    await asyncio.sleep(0.15)
+
+    mock_orchestrator.handle_incoming_message.assert_called_once()
+    assert coord._buffers == {}
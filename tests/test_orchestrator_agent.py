@@ -0,0 +1,80 @@
+"""Tests for the OrchestratorAgent's use of the semantic response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.agents.memory_agent import MemoryContext
+from app.agents.orchestrator_agent import OrchestratorAgent
+from app.models.schemas import GeneratedResponse, PreCheckResult
+
+
+def _orchestrator(answer: GeneratedResponse, precheck: PreCheckResult | None):
+    # AsyncMock sub-agents so every method (including shutdown) is awaitable.
+    memory_agent = AsyncMock()
+    memory_agent.fetch_context.return_value = MemoryContext()
+    response_agent = AsyncMock()
+    response_agent.generate.return_value = answer
+    postprocessing_agent = AsyncMock()
+    postprocessing_agent.process.return_value = answer
+    precheck_agent = None
+    if precheck is not None:
+        precheck_agent = AsyncMock()
+        precheck_agent.classify.return_value = precheck
+    cache = MagicMock()
+    cache.make_key = AsyncMock(return_value=object())
+    cache.lookup = MagicMock(return_value=None)
+
+    orchestrator = OrchestratorAgent(
+        memory_agent=memory_agent,
+        response_agent=response_agent,
+        postprocessing_agent=postprocessing_agent,
+        slack_agent=AsyncMock(),
+        precheck_agent=precheck_agent,
+        mock_mode=True,
+        response_cache=cache,
+    )
+    return orchestrator, cache
+
+
+async def _handle(orchestrator: OrchestratorAgent) -> None:
+    await orchestrator.handle_incoming_message(
+        conversation_id="conv-1", message_body="how soon?", user_id="user-1"
+    )
+    await orchestrator.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cache_bypassed_without_precheck():
+    answer = GeneratedResponse(text="Within a day.", confidence=0.95)
+    orchestrator, cache = _orchestrator(answer, precheck=None)
+
+    await _handle(orchestrator)
+
+    cache.make_key.assert_not_awaited()
+    cache.lookup.assert_not_called()
+    cache.store.assert_not_called()
+    assert orchestrator.sent_replies
+
+
+@pytest.mark.asyncio
+async def test_followup_answer_not_stored():
+    answer = GeneratedResponse(text="Within a day.", confidence=0.95, is_followup=True)
+    orchestrator, cache = _orchestrator(answer, precheck=PreCheckResult())
+
+    await _handle(orchestrator)
+
+    cache.lookup.assert_called_once()
+    cache.store.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_confident_standalone_answer_stored():
+    answer = GeneratedResponse(text="Reset it in settings.", confidence=0.95)
+    orchestrator, cache = _orchestrator(answer, precheck=PreCheckResult())
+
+    await _handle(orchestrator)
+
+    cache.store.assert_called_once()
@@ -0,0 +1,83 @@
+"""Tests for the PostProcessingAgent clean-response fast path."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.agents.postprocessing_agent import PostProcessingAgent
+from app.chat.trace import TraceCollector
+from app.models.schemas import GeneratedResponse, PostProcessorOutput
+
+
+@pytest.fixture
+def call_llm():
+    # Agents use __slots__, so patch the method on the class.
+    output = PostProcessorOutput(refined_text="fixed", final_confidence=0.8)
+    with patch.object(PostProcessingAgent, "_call_llm", AsyncMock(return_value=output)) as mock:
+        yield mock
+
+
+@pytest.fixture
+def agent(call_llm):
+    return PostProcessingAgent(api_key="test-key")
+
+
+@pytest.mark.asyncio
+async def test_clean_first_turn_review_draft_skips_llm(agent, call_llm):
+    draft = GeneratedResponse(
+        text="You can reset your API key from the dashboard settings page.",
+        confidence=0.55,
+    )
+    trace = TraceCollector()
+
+    result = await agent.process("How do I reset my key?", draft, trace=trace)
+
+    assert result is draft
+    call_llm.assert_not_awaited()
+    (event,) = trace.serialize()
+    assert event["details"] == {"confidence": 0.55, "threshold": 0.8}
+
+
+@pytest.mark.asyncio
+async def test_clean_auto_send_candidate_still_goes_to_llm(agent, call_llm):
+    # The regex cannot tell an off-topic answer from a relevant one, so a
+    # draft that would auto-send always gets the relevance check.
+    draft = GeneratedResponse(
+        text="You can reset your API key from the dashboard settings page.",
+        confidence=0.9,
+    )
+
+    result = await agent.process("How do I rename my organization?", draft)
+
+    assert result.text == "fixed"
+    call_llm.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Great question! You can reset it from the dashboard.",
+        "Use `client.reset()` to reset it.",
+        "Pass org_id when creating the client.",
+        "You can reset it from the dashboard — under settings.",
+    ],
+)
+async def test_response_needing_fixes_goes_to_llm(agent, call_llm, text):
+    draft = GeneratedResponse(text=text, confidence=0.5)
+
+    result = await agent.process("How do I reset my key?", draft)
+
+    assert result.text == "fixed"
+    call_llm.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_follow_up_always_goes_to_llm(agent, call_llm):
+    draft = GeneratedResponse(text="It usually takes a day.", confidence=0.5)
+
+    await agent.process("how soon?", draft, conversation_history=[{"memory": "..."}])
+
+    call_llm.assert_awaited_once()
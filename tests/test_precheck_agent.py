@@ -0,0 +1,66 @@
+"""Tests for PreCheckAgent's local explicit-human-request fast path."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.precheck_agent import _HUMAN_REQUEST_RE, PreCheckAgent
+from app.models.schemas import RoutingDecision
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "talk to a human",
+        "Can I speak with a real person?",
+        "I want to talk to a representative please",
+        "Hi, connect me to support.",
+        "transfer me to an agent",
+        "Please put me through to a live agent!",
+        "I want a real person",
+        "real human please",
+        "escalate this",
+        "Get me a manager.",
+        "I need human help",
+        "This bot is not helping. Let me speak to a human.",
+    ],
+)
+def test_explicit_human_requests_match(message):
+    assert _HUMAN_REQUEST_RE.search(message)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "How do I transfer memories to someone else's account?",
+        "transfer me the ownership of this project",
+        "Can I talk to someone about upgrading my plan?",
+        "talk to a human about billing",
+        "How do I connect my agent to the memory API?",
+        "Is there a real person API field in the user profile?",
+        "I don't want to talk to a human, just tell me the rate limit.",
+        "How do agents chat with a person via the SDK?",
+        "Can the human agent flag be set per user?",
+    ],
+)
+def test_ambiguous_messages_do_not_match(message):
+    assert not _HUMAN_REQUEST_RE.search(message)
+
+
+@pytest.mark.asyncio
+async def test_human_request_escalates_without_llm_call():
+    agent = PreCheckAgent(api_key="test")
+
+    async def fail(**kwargs):
+        raise AssertionError("LLM should not be called")
+
+    agent.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fail))
+    )
+
+    result = await agent.classify("Can I speak to a human?")
+
+    assert result.requires_human_intervention is True
+    assert result.routing_decision == RoutingDecision.ESCALATE
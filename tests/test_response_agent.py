@@ -0,0 +1,130 @@
+"""Tests for ResponseAgent's streamed generation and LLM-output fast path."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.response_agent import ResponseAgent
+from app.models.schemas import GeneratedResponse, PreCheckResult
+
+
+def test_fast_path_matches_validated_model():
+    parsed = {
+        "response_text": "Use the getAll API call.",
+        "confidence": 0.85,
+        "reasoning": "FAQ match",
+        "is_followup": True,
+        "followup_context": "exports",
+    }
+
+    fast = ResponseAgent._result_from_output(parsed)
+    validated = GeneratedResponse(
+        text="Use the getAll API call.",
+        confidence=0.85,
+        reasoning="FAQ match",
+        is_followup=True,
+        followup_context="exports",
+    )
+
+    assert fast == validated
+
+
+def test_fast_path_takes_classification_from_precheck():
+    parsed = {"response_text": "", "confidence": 1, "requires_human_intervention": False}
+    precheck = PreCheckResult(requires_human_intervention=True, answerable_from_context=False)
+
+    result = ResponseAgent._result_from_output(parsed, precheck)
+
+    assert result == GeneratedResponse(
+        text="",
+        confidence=1.0,
+        requires_human_intervention=True,
+        answerable_from_context=False,
+    )
+    assert isinstance(result.confidence, float)
+
+
+class _FakeStream:
+    """Async iterator over canned content deltas, like an OpenAI stream."""
+
+    def __init__(self, deltas: list[str]) -> None:
+        self._deltas = iter(deltas)
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        delta = next(self._deltas, None)
+        if delta is None:
+            raise StopAsyncIteration
+        self.consumed += 1
+        return SimpleNamespace(
+            usage=None,
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))],
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _agent_streaming(stream: _FakeStream) -> ResponseAgent:
+    agent = ResponseAgent(api_key="test")
+
+    async def create(**kwargs):
+        return stream
+
+    agent.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return agent
+
+
+def _split(text: str, size: int = 3) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.asyncio
+async def test_streamed_confidence_reported_once():
+    raw = (
+        '{"response_text": "Go to Settings > Export.", '
+        '"confidence": 0.92, "reasoning": "documented in the FAQ"}'
+    )
+    stream = _FakeStream(_split(raw))
+    seen: list[float] = []
+
+    result = await _agent_streaming(stream)._call_openai(
+        "how do I export?", [], [], on_confidence=seen.append
+    )
+
+    assert seen == [0.92]
+    assert result.text == "Go to Settings > Export."
+    assert result.confidence == 0.92
+    assert stream.consumed == len(_split(raw))
+
+
+@pytest.mark.asyncio
+async def test_empty_low_confidence_answer_stops_stream_early():
+    raw = (
+        '{"response_text": "", "confidence": 0.1, '
+        '"reasoning": "' + "nothing in memory " * 20 + '"}'
+    )
+    deltas = _split(raw)
+    stream = _FakeStream(deltas)
+    seen: list[float] = []
+    precheck = PreCheckResult(requires_human_intervention=True)
+
+    result = await _agent_streaming(stream)._call_openai(
+        "cancel my contract", [], [], precheck=precheck, on_confidence=seen.append
+    )
+
+    assert seen == [0.1]
+    assert stream.closed
+    assert stream.consumed < len(deltas)
+    assert result.text == ""
+    assert result.confidence == 0.1
+    assert result.reasoning == "Empty low-confidence answer; stream stopped before reasoning."
+    assert result.requires_human_intervention is True
@@ -0,0 +1,92 @@
+"""Tests for the SemanticResponseCache lookup/store logic."""
+
+from __future__ import annotations
+
+from app.models.schemas import GeneratedResponse
+from app.services.response_cache import (
+    CacheKey,
+    SemanticResponseCache,
+    _context_digest,
+    _normalize,
+)
+
+
+def _key(
+    vec: list[float],
+    matches: list[dict] | None = None,
+    name: str = "",
+    user_id: str = "",
+) -> CacheKey:
+    return CacheKey(
+        embedding=_normalize(vec),
+        context_digest=_context_digest(matches or [], name, user_id),
+    )
+
+
+def _cache(**kwargs) -> SemanticResponseCache:
+    return SemanticResponseCache(api_key="test", **kwargs)
+
+
+def test_similar_message_hits():
+    cache = _cache(similarity_threshold=0.9)
+    answer = GeneratedResponse(text="Reset it in settings.", confidence=0.9)
+    cache.store(_key([1.0, 0.0, 0.1]), answer)
+
+    assert cache.lookup(_key([1.0, 0.0, 0.12])) is answer
+
+
+def test_dissimilar_message_misses():
+    cache = _cache(similarity_threshold=0.9)
+    cache.store(_key([1.0, 0.0]), GeneratedResponse(text="a", confidence=0.9))
+
+    assert cache.lookup(_key([0.0, 1.0])) is None
+
+
+def test_different_kb_matches_miss():
+    cache = _cache(similarity_threshold=0.9)
+    cache.store(
+        _key([1.0, 0.0], [{"id": "m1"}]),
+        GeneratedResponse(text="a", confidence=0.9),
+    )
+
+    assert cache.lookup(_key([1.0, 0.0], [{"id": "m2"}])) is None
+
+
+def test_different_customer_misses():
+    cache = _cache(similarity_threshold=0.9)
+    cache.store(
+        _key([1.0, 0.0], name="Ada"),
+        GeneratedResponse(text="Hi Ada!", confidence=0.9),
+    )
+
+    assert cache.lookup(_key([1.0, 0.0], name="Grace")) is None
+
+
+def test_same_name_different_user_misses():
+    cache = _cache(similarity_threshold=0.9)
+    cache.store(
+        _key([1.0, 0.0], name="Alex", user_id="alex@a.example"),
+        GeneratedResponse(text="Your key for alex@a.example ...", confidence=0.9),
+    )
+
+    assert cache.lookup(_key([1.0, 0.0], name="Alex", user_id="alex@b.example")) is None
+    assert cache.lookup(_key([1.0, 0.0], user_id="conv-2")) is None
+
+
+def test_expired_entries_are_dropped():
+    cache = _cache(ttl_seconds=0.0)
+    cache.store(_key([1.0, 0.0]), GeneratedResponse(text="a", confidence=0.9))
+
+    assert cache.lookup(_key([1.0, 0.0])) is None
+    assert len(cache) == 0
+
+
+def test_oldest_entry_evicted_when_full():
+    cache = _cache(max_entries=2)
+    first = GeneratedResponse(text="first", confidence=0.9)
+    cache.store(_key([1.0, 0.0, 0.0]), first)
+    cache.store(_key([0.0, 1.0, 0.0]), GeneratedResponse(text="b", confidence=0.9))
+    cache.store(_key([0.0, 0.0, 1.0]), GeneratedResponse(text="c", confidence=0.9))
+
+    assert len(cache) == 2
+    assert cache.lookup(_key([1.0, 0.0, 0.0])) is None
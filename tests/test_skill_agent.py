@@ -0,0 +1,139 @@
+"""Tests for the SkillAgent answer cache and speculative plan."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skill_consumer import SkillAgent
+from skill_consumer.config import SkillAgentConfig
+from skill_consumer.retriever import RetrievedFile
+from skill_consumer.schemas import FileRequest, PlanDecision, SkillAgentResponse
+
+QUESTION = "How do I add a memory with metadata?"
+
+
+def _response(text: str = "Use client.add(...)") -> SkillAgentResponse:
+    return SkillAgentResponse(answer_text=text, confidence=0.8, reasoning="r", sources=[])
+
+
+class _SlowAnswer:
+    """Stand-in for the full loop that counts runs."""
+
+    def __init__(self, response: SkillAgentResponse) -> None:
+        self.response = response
+        self.calls = 0
+
+    async def answer(self, question: str) -> SkillAgentResponse:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return self.response
+
+
+@pytest.mark.asyncio
+async def test_repeat_question_served_from_cache():
+    agent = SkillAgent(openai_api_key="test")
+    run = _SlowAnswer(_response())
+    with patch.object(SkillAgent, "_answer_uncached", new=run.answer):
+        first = await agent.answer(QUESTION)
+        second = await agent.answer("  how do I add a MEMORY with metadata? ")
+
+    assert second is first
+    assert run.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_questions_share_one_run():
+    agent = SkillAgent(openai_api_key="test")
+    run = _SlowAnswer(_response())
+    with patch.object(SkillAgent, "_answer_uncached", new=run.answer):
+        results = await asyncio.gather(*(agent.answer(QUESTION) for _ in range(3)))
+
+    assert run.calls == 1
+    assert all(r is results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_empty_answer_not_cached():
+    agent = SkillAgent(openai_api_key="test")
+    run = _SlowAnswer(_response(text=""))
+    with patch.object(SkillAgent, "_answer_uncached", new=run.answer):
+        await agent.answer(QUESTION)
+        await agent.answer(QUESTION)
+
+    assert run.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_shared_run():
+    agent = SkillAgent(openai_api_key="test")
+    run = _SlowAnswer(_response())
+    with patch.object(SkillAgent, "_answer_uncached", new=run.answer):
+        first = asyncio.create_task(agent.answer(QUESTION))
+        second = asyncio.create_task(agent.answer(QUESTION))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).answer_text == "Use client.add(...)"
+    assert first.cancelled()
+    assert run.calls == 1
+
+
+def _file(path: str, base: str) -> RetrievedFile:
+    return RetrievedFile(
+        relative_path=path, skill_name="s", base_path=base,
+        file_type="reference", description="", bm25_score=1.0,
+    )
+
+
+def _plan_for(*paths: str) -> PlanDecision:
+    return PlanDecision(
+        reasoning="r", files_to_read=[FileRequest(path=p, reason="r") for p in paths]
+    )
+
+
+async def _run_with_spec_plan(spec_plan: PlanDecision):
+    """Answer QUESTION where raw-question and keyword searches disagree."""
+    agent = SkillAgent(
+        openai_api_key="test", config=SkillAgentConfig(max_iterations=1)
+    )
+    spec_files = [_file("a.md", "/spec")]
+    keyword_files = [_file("b.md", "/kw")]
+    agent._retriever = SimpleNamespace(
+        search=lambda queries, top_k: spec_files if queries == [QUESTION] else keyword_files
+    )
+
+    async def plan(question, file_lines):
+        paths = [path for path, _ in file_lines]
+        return spec_plan if paths == ["a.md"] else _plan_for("b.md")
+
+    plan_mock = AsyncMock(side_effect=plan)
+    read = AsyncMock(return_value={"content": "doc"})
+    with patch.object(SkillAgent, "_extract_keywords", AsyncMock(return_value=["k"])), \
+            patch.object(SkillAgent, "_plan", plan_mock), \
+            patch.object(SkillAgent, "_synthesize", AsyncMock(return_value=_response())), \
+            patch("skill_consumer.agent.read_file", read):
+        await agent._answer_uncached(QUESTION)
+    read_paths = {(call.args[0], call.args[1]) for call in read.call_args_list}
+    return agent, plan_mock, read_paths
+
+
+@pytest.mark.asyncio
+async def test_speculative_plan_reused_when_its_files_were_found():
+    agent, plan_mock, read_paths = await _run_with_spec_plan(_plan_for("a.md"))
+
+    assert plan_mock.await_count == 1
+    assert ("/spec", "a.md") in read_paths
+    assert (agent._spec_plan_reused, agent._spec_plan_finished) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_speculative_plan_discarded_for_unknown_file():
+    agent, plan_mock, read_paths = await _run_with_spec_plan(_plan_for("ghost.md"))
+
+    assert plan_mock.await_count == 2
+    assert ("/kw", "b.md") in read_paths
+    assert (agent._spec_plan_reused, agent._spec_plan_finished) == (0, 1)
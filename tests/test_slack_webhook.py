@@ -0,0 +1,59 @@
+"""Tests for the Slack edit modal's private_metadata round trip."""
+
+from __future__ import annotations
+
+import os
+
+import orjson
+
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "test")
+
+from app.webhooks.slack import (  # noqa: E402
+    _PRIVATE_METADATA_MAX_CHARS,
+    _pack_edit_metadata,
+    _unpack_edit_metadata,
+)
+
+IDS = ("conv-1", "user-1", "C123", "1700000000.000100")
+
+
+def test_round_trip_keeps_customer_message():
+    message = "Line one\nwith a \x1f separator inside"
+
+    packed = _pack_edit_metadata(*IDS, message)
+
+    assert _unpack_edit_metadata(packed) == (*IDS, message)
+
+
+def test_empty_customer_message_round_trips():
+    assert _unpack_edit_metadata(_pack_edit_metadata(*IDS, "")) == (*IDS, "")
+
+
+def test_oversized_customer_message_is_dropped():
+    packed = _pack_edit_metadata(*IDS, "x" * _PRIVATE_METADATA_MAX_CHARS)
+
+    assert len(packed) <= _PRIVATE_METADATA_MAX_CHARS
+    assert _unpack_edit_metadata(packed) == (*IDS, None)
+
+
+def test_legacy_json_metadata_still_decodes():
+    legacy = orjson.dumps({
+        "conversation_id": "conv-1",
+        "user_id": "user-1",
+        "channel_id": "C123",
+        "message_ts": "1700000000.000100",
+    }).decode()
+
+    assert _unpack_edit_metadata(legacy) == (*IDS, None)
+
+
+def test_legacy_json_metadata_with_customer_message():
+    legacy = orjson.dumps({
+        "conversation_id": "conv-1",
+        "channel_id": "C123",
+        "message_ts": "1700000000.000100",
+        "customer_message": "hi",
+    }).decode()
+
+    assert _unpack_edit_metadata(legacy) == ("conv-1", "", "C123", "1700000000.000100", "hi")
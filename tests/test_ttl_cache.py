@@ -0,0 +1,49 @@
+"""Tests for the shared TTL + LRU cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+def test_entry_expires_after_ttl():
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=10, max_entries=4)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.put("a", 1)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_evicted():
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=60, max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidate_by_predicate():
+    cache: TTLCache[tuple[str, str], int] = TTLCache(ttl_seconds=60, max_entries=8)
+    cache.put(("u1", "q1"), 1)
+    cache.put(("u1", "q2"), 2)
+    cache.put(("u2", "q1"), 3)
+
+    cache.invalidate(lambda key: key[0] == "u1")
+
+    assert len(cache) == 1
+    assert cache.get(("u2", "q1")) == 3
+
+
+def test_zero_ttl_disables_cache():
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=0, max_entries=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None